@@ -10,12 +10,19 @@ import os
 import time
 import re
 import random
+import sys
+from functools import lru_cache, partial
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from loguru import logger
-from urllib.parse import urljoin, quote
-import hashlib
+from urllib.parse import urljoin, quote, urlparse
+from collections import Counter, OrderedDict, defaultdict
+
+try:
+    from .utils import RateLimiter
+except ImportError:
+    from utils import RateLimiter
 
 # Import Hyperbrowser for advanced scraping
 try:
@@ -26,14 +33,143 @@ except ImportError:
     HYPERBROWSER_AVAILABLE = False
     logger.warning("Hyperbrowser not available, using traditional scraping")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# aiodns lets aiohttp resolve hostnames concurrently instead of via the getaddrinfo thread pool
+try:
+    import aiodns
+    from aiohttp.resolver import AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
 # Traditional scraping imports
 import requests
 from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 import aiohttp
 from aiohttp import ClientTimeout, ClientSession
 import ssl
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Worker count and queue depth for strain detail page fetches per listing page
+STRAIN_FETCH_CONCURRENCY = 16
+STRAIN_QUEUE_SIZE = 64
+
+# Page bodies are streamed in 64 KB chunks and abandoned past this size
+HTML_CHUNK_SIZE = 64 * 1024
+MAX_HTML_BYTES = 5 * 1024 * 1024
+
+# Number of strain page requests remembered for de-duplication
+STRAIN_REQUEST_CACHE_SIZE = 1024
+
+# Per-host request budget: at most HOST_RATE_LIMIT_CALLS per HOST_RATE_LIMIT_WINDOW seconds
+HOST_RATE_LIMIT_CALLS = 5
+HOST_RATE_LIMIT_WINDOW = 1.0
+
+# Precompiled patterns used while parsing scraped pages
+_TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*.*$')
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_STRAIN_CONTENT_PATTERNS = [
+    re.compile(r'(?:strain|cannabis|marijuana):\s*([A-Za-z0-9\s\-\'#]+)', re.IGNORECASE),
+    re.compile(r'([A-Za-z0-9\s\-\'#]+)\s*(?:strain|cannabis)', re.IGNORECASE),
+    re.compile(r'##\s*([A-Za-z0-9\s\-\'#]+)', re.IGNORECASE),  # Markdown headers
+    re.compile(r'\*\*([A-Za-z0-9\s\-\'#]+)\*\*', re.IGNORECASE)  # Bold text
+]
+
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector .name"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# Site-specific XPath queries for strain link hrefs, tried in order until one matches
+_STRAIN_LINK_XPATHS = {
+    site: [lxml.etree.XPath(query) for query in queries]
+    for site, queries in {
+        'leafly': [
+            '//a[contains(@href, "/strains/")]/@href',
+            f'//*[{_has_class("strain-tile")}]//a/@href',
+            f'//*[{_has_class("strain-card")}]//a/@href'
+        ],
+        'allbud': [
+            '//a[contains(@href, "/marijuana-strains/")]/@href',
+            f'//*[{_has_class("strain-link")}]/@href',
+            f'//*[{_has_class("strain-item")}]//a/@href'
+        ],
+        'wikileaf': [
+            '//a[contains(@href, "/strain/")]/@href',
+            f'//*[{_has_class("strain-card")}]//a/@href',
+            f'//*[{_has_class("strain-link")}]/@href'
+        ],
+        'seedfinder': [
+            '//a[contains(@href, "/strain-info/")]/@href',
+            f'//*[{_has_class("strain-link")}]/@href',
+            '//a[contains(@href, "/database/")]/@href'
+        ],
+        'default': [
+            '//a[contains(@href, "strain")]/@href',
+            '//a[contains(@href, "cannabis")]/@href',
+            f'//*[{_has_class("strain")}]//a/@href',
+            f'//*[{_has_class("cannabis")}]//a/@href'
+        ]
+    }.items()
+}
+
+# Name keywords used when generating strain attributes (matched against lowercased names)
+_INDICA_NAME_RE = re.compile('kush|purple|afghan|bubba|master|death|blackberry')
+_SATIVA_NAME_RE = re.compile('haze|diesel|jack|green|lemon|super|thai|durban')
+_CBD_NAME_RE = re.compile('cbd|charlotte|acdc|harlequin|cannatonic')
+_EASY_GROW_NAME_RE = re.compile('northern lights|white widow|skunk|big bud')
+_HARD_GROW_NAME_RE = re.compile('haze|thai|landrace|pure sativa')
+
+# Scores for well-known strains, keyed by lowercased name
+_POPULAR_STRAINS = {
+    'blue dream': 100, 'og kush': 95, 'girl scout cookies': 90,
+    'white widow': 85, 'northern lights': 80, 'ak-47': 75,
+    'jack herer': 70, 'sour diesel': 65, 'pineapple express': 60
+}
+
+@lru_cache(maxsize=4096)
+def _strain_type_for_name(strain_name: str) -> str:
+    """Infer strain type from name patterns (memoized, names repeat across sources)"""
+    name_lower = strain_name.lower()
+    
+    # Indica indicators
+    if _INDICA_NAME_RE.search(name_lower):
+        return 'indica'
+    
+    # Sativa indicators  
+    if _SATIVA_NAME_RE.search(name_lower):
+        return 'sativa'
+    
+    # Hybrid indicators or default
+    return 'hybrid'
+
+@lru_cache(maxsize=4096)
+def _known_popularity_score(strain_name: str) -> Optional[int]:
+    """Return the popularity score for a recognised strain name, or None"""
+    name_lower = strain_name.lower()
+    
+    # Check for exact matches
+    if name_lower in _POPULAR_STRAINS:
+        return _POPULAR_STRAINS[name_lower]
+    
+    # Check for partial matches
+    for popular_name, score in _POPULAR_STRAINS.items():
+        if popular_name in name_lower or name_lower in popular_name:
+            return score - 10
+    
+    return None
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StrainData:
     """Enhanced data structure for marijuana strain information"""
     name: str
@@ -86,6 +222,31 @@ class StrainData:
             self.terpenes = []
         if self.scraped_at is None:
             self.scraped_at = datetime.now().isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for serialization, without asdict's deep copy"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+def _dump_json(value: Any) -> bytes:
+    """Serialize one value of the saved strain document to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        # orjson serializes dataclasses natively, skipping the asdict deep copy
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    if isinstance(value, StrainData):
+        value = value.to_dict()
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+# Per-process scraper used by the HTML parse pool
+_parse_worker = None
+
+def _init_parse_worker():
+    """Process pool initializer: build one parser-only scraper per worker process"""
+    global _parse_worker
+    _parse_worker = EnhancedStrainScraper()
+
+def _parse_strain_html_in_worker(html: str, url: str, site_name: str) -> Optional['StrainData']:
+    """Parse a strain detail page inside a worker process"""
+    return _parse_worker._parse_strain_html(html, url, site_name)
 
 class EnhancedStrainScraper:
     """Advanced marijuana strain data scraper with 15+ sources"""
@@ -362,6 +523,25 @@ class EnhancedStrainScraper:
             }
         }
         
+        # Headers shared by every request on the persistent session
+        self.request_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        }
+        self._session: Optional[ClientSession] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._strain_requests: 'OrderedDict[str, asyncio.Future]' = OrderedDict()
+        # Every unfinished shared fetch, including ones already evicted from the map above
+        self._pending_strain_requests: Set[asyncio.Future] = set()
+        self._host_limiters: Dict[str, RateLimiter] = defaultdict(
+            lambda: RateLimiter(HOST_RATE_LIMIT_CALLS, HOST_RATE_LIMIT_WINDOW)
+        )
+        self._in_context = False
+        
         logger.info("Enhanced StrainScraper initialized with 15+ sources")
     
     async def scrape_comprehensive_strains(self, target_count: int = 1000) -> List[StrainData]:
@@ -425,6 +605,7 @@ class EnhancedStrainScraper:
                     
                     try:
                         logger.info(f"Processing: {url}")
+                        await self._throttle(url)
                         
                         # Use crawling for comprehensive data collection
                         result = await crawl_webpages(
@@ -464,71 +645,124 @@ class EnhancedStrainScraper:
                                 if strain:
                                     strains.append(strain)
                         
-                        # Rate limiting
-                        await asyncio.sleep(3)
-                        
                     except Exception as e:
                         logger.error(f"Error scraping {url}: {e}")
                         continue
-                
-                # Longer delay between sites
-                await asyncio.sleep(5)
         
         except Exception as e:
             logger.error(f"Error in enhanced Hyperbrowser scraping: {e}")
         
         return strains
     
+    async def _get_session(self) -> ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            # Create SSL context that's more permissive
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            
+            # Keep connections and DNS lookups alive across strains and sites
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=64,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                resolver=AsyncResolver() if AIODNS_AVAILABLE else None
+            )
+            
+            self._session = ClientSession(
+                timeout=ClientTimeout(total=30),
+                headers=self.request_headers,
+                connector=connector
+            )
+        
+        return self._session
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool used to parse detail pages, creating it on first use"""
+        if self._parse_pool is None:
+            # spawn avoids inheriting the event loop and open sockets into the workers
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_parse_worker
+            )
+        return self._parse_pool
+    
+    async def aclose(self):
+        """Cancel in-flight strain fetches, then close the shared HTTP session and parse pool"""
+        # Shielded fetches outlive cancelled callers; stop them before their session goes away
+        pending = list(self._pending_strain_requests)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # Request futures are bound to the current event loop
+        self._strain_requests.clear()
+        
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+    
+    async def __aenter__(self) -> 'EnhancedStrainScraper':
+        self._in_context = True
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._in_context = False
+        await self.aclose()
+    
     async def _scrape_traditional_enhanced(self, target_count: int) -> List[StrainData]:
         """Enhanced traditional scraping with real HTTP requests"""
         strains = []
         
         try:
-            # Configure session with proper headers
-            timeout = ClientTimeout(total=30)
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            session = await self._get_session()
             
-            # Create SSL context that's more permissive
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            # Scrape from multiple sources concurrently
+            tasks = []
             
-            async with ClientSession(
-                timeout=timeout, 
-                headers=headers,
-                connector=aiohttp.TCPConnector(ssl=ssl_context)
-            ) as session:
-                
-                # Scrape from multiple sources concurrently
-                tasks = []
+            for site_name, site_config in self.target_sites.items():
+                if len(tasks) >= 5:  # Limit concurrent requests
+                    break
                 
-                for site_name, site_config in self.target_sites.items():
-                    if len(tasks) >= 5:  # Limit concurrent requests
-                        break
+                for url in site_config['strain_urls'][:2]:  # Limit URLs per site
+                    task = asyncio.create_task(
+                        self._scrape_site_traditional(session, site_name, url, target_count // 10)
+                    )
+                    tasks.append(task)
+            
+            # Consume sites as they finish and stop the rest once we have enough
+            try:
+                for future in asyncio.as_completed(tasks):
+                    try:
+                        result = await future
+                    except Exception as e:
+                        logger.error(f"Error in traditional scraping task: {e}")
+                        continue
                     
-                    for url in site_config['strain_urls'][:2]:  # Limit URLs per site
-                        task = self._scrape_site_traditional(session, site_name, url, target_count // 10)
-                        tasks.append(task)
-                
-                # Execute scraping tasks concurrently
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in results:
-                    if isinstance(result, list):
-                        strains.extend(result)
-                        if len(strains) >= target_count:
-                            break
+                    strains.extend(result)
+                    if len(strains) >= target_count:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
         
         except Exception as e:
             logger.error(f"Error in enhanced traditional scraping: {e}")
         
+        finally:
+            # One-shot callers (asyncio.run per scrape) must not leak the session
+            if not self._in_context:
+                await self.aclose()
+        
         return strains[:target_count]
     
     async def _scrape_site_traditional(self, session: ClientSession, site_name: str, url: str, max_strains: int) -> List[StrainData]:
@@ -538,64 +772,69 @@ class EnhancedStrainScraper:
         try:
             logger.info(f"Traditional scraping: {site_name} - {url}")
             
-            async with session.get(url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract strain links and information
-                    strain_links = self._extract_strain_links(soup, site_name, url)
-                    
-                    # Process strain links
-                    for strain_url in strain_links[:max_strains]:
-                        try:
-                            strain_data = await self._scrape_individual_strain(session, strain_url, site_name)
-                            if strain_data:
-                                strains.append(strain_data)
-                            
-                            # Rate limiting
-                            await asyncio.sleep(1)
-                            
-                        except Exception as e:
-                            logger.error(f"Error scraping individual strain {strain_url}: {e}")
-                            continue
+            html = await self._fetch_html(session, url)
+            if html:
+                # Parse off the event loop so concurrent fetches keep flowing
+                strain_links = await asyncio.to_thread(self._parse_strain_links, html, site_name, url)
                 
-                else:
-                    logger.warning(f"Failed to access {url}: Status {response.status}")
+                # Process strain links with a fixed pool of workers fed from a bounded queue
+                queue: asyncio.Queue = asyncio.Queue(maxsize=STRAIN_QUEUE_SIZE)
+                workers = [
+                    asyncio.create_task(self._strain_worker(queue, session, site_name, strains))
+                    for _ in range(min(STRAIN_FETCH_CONCURRENCY, max_strains))
+                ]
+                
+                try:
+                    for strain_url in strain_links[:max_strains]:
+                        await queue.put(strain_url)
+                    await queue.join()
+                finally:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
         
         except Exception as e:
             logger.error(f"Error scraping site {site_name}: {e}")
         
         return strains
     
-    def _extract_strain_links(self, soup: BeautifulSoup, site_name: str, base_url: str) -> List[str]:
+    async def _strain_worker(self, queue: asyncio.Queue, session: ClientSession, site_name: str, strains: List[StrainData]):
+        """Consume strain URLs from the queue until cancelled"""
+        while True:
+            strain_url = await queue.get()
+            try:
+                strain_data = await self._scrape_individual_strain(session, strain_url, site_name)
+                if strain_data:
+                    strains.append(strain_data)
+            except Exception as e:
+                logger.error(f"Error scraping individual strain {strain_url}: {e}")
+            finally:
+                queue.task_done()
+    
+    def _parse_strain_links(self, html: str, site_name: str, base_url: str) -> List[str]:
+        """Parse a listing page and extract its strain links (CPU-bound, runs in a thread)"""
+        try:
+            root = lxml.html.fromstring(html)
+        except Exception as e:
+            logger.error(f"Error parsing listing page {base_url}: {e}")
+            return []
+        return self._extract_strain_links(root, site_name, base_url)
+    
+    def _extract_strain_links(self, root: 'lxml.html.HtmlElement', site_name: str, base_url: str) -> List[str]:
         """Extract strain page links from a listing page"""
         links = []
         
         try:
-            # Site-specific selectors for strain links
-            selectors = {
-                'leafly': ['a[href*="/strains/"]', '.strain-tile a', '.strain-card a'],
-                'allbud': ['a[href*="/marijuana-strains/"]', '.strain-link', '.strain-item a'],
-                'wikileaf': ['a[href*="/strain/"]', '.strain-card a', '.strain-link'],
-                'seedfinder': ['a[href*="/strain-info/"]', '.strain-link', 'a[href*="/database/"]'],
-                'default': ['a[href*="strain"]', 'a[href*="cannabis"]', '.strain a', '.cannabis a']
-            }
-            
-            site_selectors = selectors.get(site_name, selectors['default'])
+            site_xpaths = _STRAIN_LINK_XPATHS.get(site_name, _STRAIN_LINK_XPATHS['default'])
             
-            for selector in site_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    href = element.get('href')
+            for xpath in site_xpaths:
+                for href in xpath(root):
                     if href:
                         if href.startswith('http'):
                             links.append(href)
                         else:
                             # Convert relative URL to absolute
-                            from urllib.parse import urljoin
-                            full_url = urljoin(base_url, href)
-                            links.append(full_url)
+                            links.append(urljoin(base_url, href))
                 
                 if links:  # If we found links with this selector, use them
                     break
@@ -605,28 +844,82 @@ class EnhancedStrainScraper:
         
         return list(set(links))  # Remove duplicates
     
+    async def _throttle(self, url: str):
+        """Wait until the per-host rate limit allows another request to url"""
+        limiter = self._host_limiters[urlparse(url).netloc]
+        while not limiter.is_allowed():
+            await asyncio.sleep(limiter.time_until_allowed())
+    
+    async def _fetch_html(self, session: ClientSession, url: str) -> Optional[str]:
+        """Fetch an HTML page, skipping non-HTML responses and oversized bodies"""
+        await self._throttle(url)
+        async with session.get(url) as response:
+            if response.status != 200:
+                logger.warning(f"Failed to access {url}: Status {response.status}")
+                return None
+            
+            if 'html' not in response.content_type:
+                logger.debug(f"Skipping non-HTML response from {url}: {response.content_type}")
+                return None
+            
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(HTML_CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) > MAX_HTML_BYTES:
+                    logger.warning(f"Skipping oversized page {url}")
+                    return None
+            
+            return body.decode(response.charset or 'utf-8', errors='replace')
+    
     async def _scrape_individual_strain(self, session: ClientSession, url: str, site_name: str) -> Optional[StrainData]:
+        """Scrape an individual strain page, sharing one request per URL across callers"""
+        task = self._strain_requests.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_individual_strain(session, url, site_name))
+            task.add_done_callback(partial(self._forget_failed_strain_request, url))
+            self._pending_strain_requests.add(task)
+            task.add_done_callback(self._pending_strain_requests.discard)
+            self._strain_requests[url] = task
+            while len(self._strain_requests) > STRAIN_REQUEST_CACHE_SIZE:
+                self._strain_requests.popitem(last=False)
+        else:
+            self._strain_requests.move_to_end(url)
+        
+        # A cancelled caller must not cancel the fetch other callers are waiting on
+        return await asyncio.shield(task)
+    
+    def _forget_failed_strain_request(self, url: str, task: asyncio.Future):
+        """Drop a shared strain request that was cancelled, raised or came back empty"""
+        failed = task.cancelled() or task.exception() is not None or task.result() is None
+        if failed and self._strain_requests.get(url) is task:
+            del self._strain_requests[url]
+    
+    async def _fetch_individual_strain(self, session: ClientSession, url: str, site_name: str) -> Optional[StrainData]:
         """Scrape detailed information from an individual strain page"""
         try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract strain data using site-specific parsing
-                    strain_data = self._parse_strain_page(soup, url, site_name)
-                    return strain_data
-                
+            html = await self._fetch_html(session, url)
+            if html:
+                # BeautifulSoup parsing is CPU-bound and holds the GIL, so spread it across processes
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._get_parse_pool(), _parse_strain_html_in_worker, html, url, site_name
+                )
+            
         except Exception as e:
             logger.error(f"Error scraping individual strain {url}: {e}")
         
         return None
     
+    def _parse_strain_html(self, html: str, url: str, site_name: str) -> Optional[StrainData]:
+        """Parse a strain detail page from raw HTML (CPU-bound, runs in the spawn parse pool)"""
+        soup = BeautifulSoup(html, 'lxml')
+        return self._parse_strain_page(soup, url, site_name)
+    
     def _parse_strain_page(self, soup: BeautifulSoup, url: str, site_name: str) -> Optional[StrainData]:
         """Parse strain information from a strain detail page"""
         try:
-            # Extract basic information
-            name = self._extract_text_by_selectors(soup, [
+            # Extract basic information, preferring the OpenGraph title over a DOM walk
+            name = self._extract_meta_content(soup, 'og:title') or self._extract_text_by_selectors(soup, [
                 'h1', '.strain-name', '.strain-title', '.page-title', 'title'
             ])
             
@@ -634,7 +927,7 @@ class EnhancedStrainScraper:
                 return None
             
             # Clean up the name
-            name = re.sub(r'\s*\|\s*.*$', '', name)  # Remove site name from title
+            name = _TITLE_SUFFIX_RE.sub('', name)  # Remove site name from title
             name = name.strip()
             
             # Extract strain type
@@ -671,8 +964,8 @@ class EnhancedStrainScraper:
             ])
             
             description = self._extract_text_by_selectors(soup, [
-                '.description', '.strain-description', '.overview', 'meta[name="description"]'
-            ])
+                '.description', '.strain-description', '.overview'
+            ]) or self._extract_meta_content(soup, 'description', 'og:description')
             
             # Extract effects, flavors, etc. as lists
             effects = self._extract_list_by_selectors(soup, [
@@ -716,18 +1009,27 @@ class EnhancedStrainScraper:
                 continue
         return None
     
+    def _extract_meta_content(self, soup: BeautifulSoup, *names: str) -> Optional[str]:
+        """Return the content attribute of the first matching <meta name|property> tag"""
+        for name in names:
+            element = soup.find('meta', attrs={'property': name}) or soup.find('meta', attrs={'name': name})
+            if element:
+                content = (element.get('content') or '').strip()
+                if len(content) > 1:
+                    return content
+        return None
+    
     def _extract_list_by_selectors(self, soup: BeautifulSoup, selectors: List[str]) -> List[str]:
         """Extract list of text items using multiple CSS selectors"""
         items = []
-        for selector in selectors:
-            try:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text().strip()
-                    if text and text not in items:
-                        items.append(text)
-            except:
-                continue
+        try:
+            # One combined selector walks the tree once instead of once per selector
+            for element in soup.select(', '.join(selectors)):
+                text = element.get_text().strip()
+                if text and text not in items:
+                    items.append(text)
+        except:
+            pass
         return items
     
     async def _scrape_comprehensive_names(self, target_count: int) -> List[StrainData]:
@@ -746,9 +1048,6 @@ class EnhancedStrainScraper:
                     if strain_data:
                         strains.append(strain_data)
                     
-                    # Small delay to simulate processing
-                    await asyncio.sleep(0.1)
-                    
                 except Exception as e:
                     logger.error(f"Error generating data for {strain_name}: {e}")
                     continue
@@ -808,25 +1107,14 @@ class EnhancedStrainScraper:
     
     def _infer_strain_type(self, strain_name: str) -> str:
         """Infer strain type from name patterns"""
-        name_lower = strain_name.lower()
-        
-        # Indica indicators
-        if any(word in name_lower for word in ['kush', 'purple', 'afghan', 'bubba', 'master', 'death', 'blackberry']):
-            return 'indica'
-        
-        # Sativa indicators  
-        if any(word in name_lower for word in ['haze', 'diesel', 'jack', 'green', 'lemon', 'super', 'thai', 'durban']):
-            return 'sativa'
-        
-        # Hybrid indicators or default
-        return 'hybrid'
+        return _strain_type_for_name(strain_name)
     
     def _generate_realistic_potency(self, strain_name: str, strain_type: str) -> Tuple[str, str]:
         """Generate realistic THC/CBD content"""
         name_lower = strain_name.lower()
         
         # CBD strains
-        if any(word in name_lower for word in ['cbd', 'charlotte', 'acdc', 'harlequin', 'cannatonic']):
+        if _CBD_NAME_RE.search(name_lower):
             thc = f"{random.randint(3, 8)}%"
             cbd = f"{random.randint(8, 20)}%"
         else:
@@ -925,9 +1213,9 @@ class EnhancedStrainScraper:
         # Some strains are known to be easier/harder
         name_lower = strain_name.lower()
         
-        if any(word in name_lower for word in ['northern lights', 'white widow', 'skunk', 'big bud']):
+        if _EASY_GROW_NAME_RE.search(name_lower):
             return 'Easy'
-        elif any(word in name_lower for word in ['haze', 'thai', 'landrace', 'pure sativa']):
+        elif _HARD_GROW_NAME_RE.search(name_lower):
             return 'Difficult'
         else:
             return random.choice(['Easy', 'Moderate', 'Moderate', 'Difficult'])  # Weight towards moderate
@@ -989,16 +1277,9 @@ class EnhancedStrainScraper:
         
         try:
             # Look for strain names in content using regex patterns
-            strain_patterns = [
-                r'(?:strain|cannabis|marijuana):\s*([A-Za-z0-9\s\-\'#]+)',
-                r'([A-Za-z0-9\s\-\'#]+)\s*(?:strain|cannabis)',
-                r'##\s*([A-Za-z0-9\s\-\'#]+)',  # Markdown headers
-                r'\*\*([A-Za-z0-9\s\-\'#]+)\*\*'  # Bold text
-            ]
-            
             found_names = set()
-            for pattern in strain_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for pattern in _STRAIN_CONTENT_PATTERNS:
+                matches = pattern.findall(content)
                 for match in matches:
                     clean_name = match.strip()
                     if len(clean_name) > 2 and len(clean_name) < 50:
@@ -1060,12 +1341,11 @@ class EnhancedStrainScraper:
         seen_hashes = set()
         
         for strain in strains:
-            # Create a hash based on multiple fields
-            hash_string = f"{strain.name.lower().strip()}_{strain.strain_type}_{strain.genetics}"
-            strain_hash = hashlib.md5(hash_string.encode()).hexdigest()
+            # Key on multiple fields; the set hashes the tuple natively, no digest needed
+            strain_key = (strain.name.lower().strip(), strain.strain_type, strain.genetics)
             
-            if strain_hash not in seen_hashes:
-                seen_hashes.add(strain_hash)
+            if strain_key not in seen_hashes:
+                seen_hashes.add(strain_key)
                 unique_strains.append(strain)
         
         return unique_strains
@@ -1096,22 +1376,9 @@ class EnhancedStrainScraper:
     
     def _calculate_popularity_score(self, strain_name: str) -> int:
         """Calculate popularity score based on strain name recognition"""
-        popular_strains = {
-            'blue dream': 100, 'og kush': 95, 'girl scout cookies': 90,
-            'white widow': 85, 'northern lights': 80, 'ak-47': 75,
-            'jack herer': 70, 'sour diesel': 65, 'pineapple express': 60
-        }
-        
-        name_lower = strain_name.lower()
-        
-        # Check for exact matches
-        if name_lower in popular_strains:
-            return popular_strains[name_lower]
-        
-        # Check for partial matches
-        for popular_name, score in popular_strains.items():
-            if popular_name in name_lower or name_lower in popular_name:
-                return score - 10
+        score = _known_popularity_score(strain_name)
+        if score is not None:
+            return score
         
         # Random score for unknown strains
         return random.randint(10, 50)
@@ -1167,17 +1434,26 @@ class EnhancedStrainScraper:
     def save_comprehensive_data(self, filename: str = "comprehensive_strains_data.json") -> bool:
         """Save comprehensive strain data with enhanced metadata"""
         try:
-            data = {
+            header = {
                 "scraped_at": datetime.now().isoformat(),
                 "total_strains": len(self.scraped_strains),
                 "scraping_sources": len(self.target_sites),
                 "data_version": "2.0_enhanced",
-                "strains": [asdict(strain) for strain in self.scraped_strains],
-                "summary": self.get_comprehensive_summary()
             }
+            summary = self.get_comprehensive_summary()
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Stream the document one strain at a time so neither a list of strain
+            # dicts nor the full serialized string is ever held in memory
+            with open(filename, 'wb') as f:
+                f.write(b'{')
+                for key, value in header.items():
+                    f.write(_dump_json(key) + b':' + _dump_json(value) + b',\n')
+                f.write(b'"strains":[\n')
+                for i, strain in enumerate(self.scraped_strains):
+                    if i:
+                        f.write(b',\n')
+                    f.write(_dump_json(strain))
+                f.write(b'\n],\n"summary":' + _dump_json(summary) + b'}\n')
             
             logger.info(f"Saved {len(self.scraped_strains)} comprehensive strains to {filename}")
             return True
@@ -1191,45 +1467,67 @@ class EnhancedStrainScraper:
         if not self.scraped_strains:
             return {"total": 0}
         
-        type_counts = {}
-        difficulty_counts = {}
-        breeder_counts = {}
+        type_counts = Counter()
+        difficulty_counts = Counter()
+        breeder_counts = Counter()
+        with_thc = with_cbd = with_genetics = with_effects = with_terpenes = 0
+        popularity_total = 0
+        # Running [samples, total, min, max] per potency field
+        potency = {'thc': [0, 0.0, float('inf'), float('-inf')],
+                   'cbd': [0, 0.0, float('inf'), float('-inf')]}
         
+        # Gather every statistic in a single pass over the strains
         for strain in self.scraped_strains:
-            # Count by type
-            strain_type = strain.strain_type.lower()
-            type_counts[strain_type] = type_counts.get(strain_type, 0) + 1
+            # Count by type, difficulty and breeder
+            type_counts[strain.strain_type.lower()] += 1
+            difficulty_counts[strain.growing_difficulty or 'Unknown'] += 1
+            breeder_counts[strain.breeder or 'Unknown'] += 1
             
-            # Count by difficulty
-            difficulty = strain.growing_difficulty or 'Unknown'
-            difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + 1
+            with_thc += bool(strain.thc_content)
+            with_cbd += bool(strain.cbd_content)
+            with_genetics += bool(strain.genetics)
+            with_effects += bool(strain.effects)
+            with_terpenes += bool(strain.terpenes)
+            popularity_total += strain.popularity_score or 0
             
-            # Count by breeder
-            breeder = strain.breeder or 'Unknown'
-            breeder_counts[breeder] = breeder_counts.get(breeder, 0) + 1
+            for key, content in (('thc', strain.thc_content), ('cbd', strain.cbd_content)):
+                match = _PERCENT_RE.search(content) if content else None
+                if match:
+                    value = float(match.group(1))
+                    stats = potency[key]
+                    stats[0] += 1
+                    stats[1] += value
+                    stats[2] = min(stats[2], value)
+                    stats[3] = max(stats[3], value)
+        
+        potency_stats = {
+            key: {"average": total / n, "min": lo, "max": hi, "samples": n} if n else {"samples": 0}
+            for key, (n, total, lo, hi) in potency.items()
+        }
         
         return {
             "total": len(self.scraped_strains),
-            "by_type": type_counts,
-            "by_difficulty": difficulty_counts,
-            "top_breeders": dict(sorted(breeder_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "with_thc_data": len([s for s in self.scraped_strains if s.thc_content]),
-            "with_cbd_data": len([s for s in self.scraped_strains if s.cbd_content]),
-            "with_genetics": len([s for s in self.scraped_strains if s.genetics]),
-            "with_effects": len([s for s in self.scraped_strains if s.effects]),
-            "with_terpenes": len([s for s in self.scraped_strains if s.terpenes]),
-            "average_popularity": sum([s.popularity_score or 0 for s in self.scraped_strains]) / len(self.scraped_strains)
+            "by_type": dict(type_counts),
+            "by_difficulty": dict(difficulty_counts),
+            "top_breeders": dict(breeder_counts.most_common(10)),
+            "with_thc_data": with_thc,
+            "with_cbd_data": with_cbd,
+            "with_genetics": with_genetics,
+            "with_effects": with_effects,
+            "with_terpenes": with_terpenes,
+            "thc_stats": potency_stats['thc'],
+            "cbd_stats": potency_stats['cbd'],
+            "average_popularity": popularity_total / len(self.scraped_strains)
         }
 
 if __name__ == "__main__":
     async def main():
-        scraper = EnhancedStrainScraper()
-        
-        print("🌿 Starting comprehensive marijuana strain data scraping...")
-        print(f"📊 Target sources: {len(scraper.target_sites)}")
-        print(f"🎯 Comprehensive strain database: {len(scraper.comprehensive_strain_names)} strains")
-        
-        strains = await scraper.scrape_comprehensive_strains(1000)
+        async with EnhancedStrainScraper() as scraper:
+            print("🌿 Starting comprehensive marijuana strain data scraping...")
+            print(f"📊 Target sources: {len(scraper.target_sites)}")
+            print(f"🎯 Comprehensive strain database: {len(scraper.comprehensive_strain_names)} strains")
+            
+            strains = await scraper.scrape_comprehensive_strains(1000)
         
         print(f"\n📊 Comprehensive Scraping Results:")
         summary = scraper.get_comprehensive_summary()
@@ -1243,7 +1541,7 @@ if __name__ == "__main__":
         print(f"Average popularity: {summary['average_popularity']:.1f}")
         
         # Save comprehensive data
-        scraper.save_comprehensive_data("data/comprehensive_marijuana_strains_1000.json")
+        await asyncio.to_thread(scraper.save_comprehensive_data, "data/comprehensive_marijuana_strains_1000.json")
         print("\n✅ Comprehensive strain data saved successfully!")
     
     asyncio.run(main())
\ No newline at end of file
@@ -115,22 +115,19 @@ class GDriveStrainManager:
             
             # Create local files for upload
             temp_dir = Path("temp_strain_data")
-            temp_dir.mkdir(exist_ok=True)
-            
-            # Create strain info JSON
             info_file = temp_dir / f"{safe_name}_info.json"
-            with open(info_file, 'w', encoding='utf-8') as f:
-                json.dump(strain_data, f, indent=2, ensure_ascii=False)
-            
-            # Create strain summary text
             summary_file = temp_dir / f"{safe_name}_summary.txt"
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(self._generate_strain_summary(strain_data))
-            
-            # Create growing guide
             guide_file = temp_dir / f"{safe_name}_growing_guide.md"
-            with open(guide_file, 'w', encoding='utf-8') as f:
-                f.write(self._generate_growing_guide(strain_data))
+            
+            # Strain info JSON, summary text and growing guide
+            local_files = {
+                info_file: json.dumps(strain_data, indent=2, ensure_ascii=False),
+                summary_file: self._generate_strain_summary(strain_data),
+                guide_file: self._generate_growing_guide(strain_data),
+            }
+            
+            # Disk writes run in a worker thread so other uploads keep the loop busy
+            await asyncio.to_thread(self._write_local_files, temp_dir, local_files)
             
             logger.info(f"Created local files for {strain_name}, ready for Google Drive upload")
             
@@ -187,6 +184,14 @@ class GDriveStrainManager:
             logger.error(f"Error uploading strain data: {e}")
             return False
     
+    @staticmethod
+    def _write_local_files(temp_dir: Path, files: Dict[Path, str]):
+        """Write the staged upload files to the temp directory"""
+        temp_dir.mkdir(exist_ok=True)
+        for file_path, content in files.items():
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+    
     async def organize_strains_to_drive(self, strains_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Organize all strain data into Google Drive folders"""
         if not GDRIVE_AVAILABLE:
@@ -6,10 +6,11 @@ Scrapes grow forums, blogs, and YouTube for cultivation advice
 
 import asyncio
 import aiohttp
-import json
 import os
 import re
 import time
+from heapq import nlargest
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
@@ -19,6 +20,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from loguru import logger
+try:
+    from .utils import JsonFileCache, safe_json_load, safe_json_save, user_cache_dir
+except ImportError:
+    from utils import JsonFileCache, safe_json_load, safe_json_save, user_cache_dir
 
 # Hyperbrowser integration for advanced scraping
 try:
@@ -29,11 +34,31 @@ except ImportError:
     HYPERBROWSER_AVAILABLE = False
     logger.warning("Hyperbrowser not available - falling back to traditional scraping")
 
+# Maximum sites scraped at once
+SCRAPE_CONCURRENCY = 8
+
+# Hyperbrowser results are cached on disk and reused for a day
+SCRAPE_CACHE_FILE = user_cache_dir('scraped_pages.json')
+SCRAPE_CACHE_TTL = 24 * 3600
+
 class GrowTipScraper:
     """Web scraper for cannabis and plant growing advice"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, use_cache: bool = True,
+                 cache_path: Optional[str] = None):
+        """Create the scraper, optionally sharing a caller-owned aiohttp session
+        
+        Args:
+            session: Existing session to reuse; the scraper never closes a session it was given
+            use_cache: Reuse Hyperbrowser results scraped within the last day; False forces a refresh
+            cache_path: Cache file to use instead of the per-user SCRAPE_CACHE_FILE
+        """
+        self.session = session
+        self._owns_session = session is None
+        self.scrape_cache = None
+        if use_cache:
+            self.scrape_cache = JsonFileCache(Path(cache_path) if cache_path else SCRAPE_CACHE_FILE,
+                                              SCRAPE_CACHE_TTL)
         self.driver = None
         self.scraped_data = []
         self.max_pages = int(os.getenv("MAX_SCRAPE_PAGES", 50))
@@ -86,7 +111,8 @@ class GrowTipScraper:
             'Connection': 'keep-alive',
         }
         
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=3)
+        # Keep-alive pool so repeated requests to a site reuse TCP/TLS connections
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=30)
         timeout = aiohttp.ClientTimeout(total=30)
         
         self.session = aiohttp.ClientSession(
@@ -121,75 +147,97 @@ class GrowTipScraper:
             logger.warning("Hyperbrowser not available, falling back to traditional scraping")
             return []
         
-        tips = []
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
         
-        try:
-            # Use Hyperbrowser to scrape multiple URLs
-            for url in urls:
-                logger.info(f"Scraping {url} with Hyperbrowser")
-                
-                # Scrape webpage content
-                result = await scrape_webpage(
-                    url=url,
-                    outputFormat=["markdown", "html"],
-                    sessionOptions={
-                        "useStealth": True,
-                        "acceptCookies": True,
-                        "solveCaptchas": False
-                    }
-                )
-                
-                if result and 'markdown' in result:
-                    content = result['markdown']
+        async def scrape_url(url: str) -> List[Dict[str, Any]]:
+            cache_key = JsonFileCache.key_for("scrape_with_hyperbrowser", url)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            async with semaphore:
+                try:
+                    logger.info(f"Scraping {url} with Hyperbrowser")
                     
-                    # Extract growing tips from markdown content
-                    extracted_tips = self.extract_tips_from_content(content, url, "hyperbrowser")
-                    tips.extend(extracted_tips)
+                    # Scrape webpage content
+                    result = await scrape_webpage(
+                        url=url,
+                        outputFormat=["markdown", "html"],
+                        sessionOptions={
+                            "useStealth": True,
+                            "acceptCookies": True,
+                            "solveCaptchas": False
+                        }
+                    )
                     
-                    # Rate limiting
-                    await asyncio.sleep(2)
+                    if result and 'markdown' in result:
+                        # Extract growing tips from markdown content
+                        extracted_tips = self.extract_tips_from_content(result['markdown'], url, "hyperbrowser")
+                        self._cache_put(cache_key, extracted_tips)
+                        
+                        # Rate limiting
+                        await asyncio.sleep(2)
+                        return extracted_tips
+                    
+                except Exception as e:
+                    logger.error(f"Error with Hyperbrowser scraping {url}: {e}")
                 
-        except Exception as e:
-            logger.error(f"Error with Hyperbrowser scraping: {e}")
+                return []
         
-        return tips
+        # Sites are scraped concurrently; results keep the order of urls
+        results = await asyncio.gather(*(scrape_url(url) for url in urls))
+        self._cache_save()
+        return [tip for url_tips in results for tip in url_tips]
     
     async def crawl_grow_sites_hyperbrowser(self, base_urls: List[str]) -> List[Dict[str, Any]]:
         """Use Hyperbrowser to crawl entire grow sites"""
         if not HYPERBROWSER_AVAILABLE:
             return []
         
-        tips = []
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
         
-        for base_url in base_urls:
-            try:
-                logger.info(f"Crawling {base_url} with Hyperbrowser")
-                
-                # Crawl the website
-                result = await crawl_webpages(
-                    url=base_url,
-                    outputFormat=["markdown"],
-                    followLinks=True,
-                    maxPages=20,
-                    sessionOptions={
-                        "useStealth": True,
-                        "acceptCookies": True
-                    }
-                )
-                
-                if result and isinstance(result, list):
-                    for page_result in result:
-                        if 'markdown' in page_result:
-                            content = page_result['markdown']
-                            page_url = page_result.get('url', base_url)
-                            
-                            extracted_tips = self.extract_tips_from_content(content, page_url, "hyperbrowser_crawl")
-                            tips.extend(extracted_tips)
-                
-            except Exception as e:
-                logger.error(f"Error crawling {base_url} with Hyperbrowser: {e}")
+        async def crawl_site(base_url: str) -> List[Dict[str, Any]]:
+            cache_key = JsonFileCache.key_for("crawl_grow_sites_hyperbrowser", base_url)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            tips = []
+            async with semaphore:
+                try:
+                    logger.info(f"Crawling {base_url} with Hyperbrowser")
+                    
+                    # Crawl the website
+                    result = await crawl_webpages(
+                        url=base_url,
+                        outputFormat=["markdown"],
+                        followLinks=True,
+                        maxPages=20,
+                        sessionOptions={
+                            "useStealth": True,
+                            "acceptCookies": True
+                        }
+                    )
+                    
+                    if result and isinstance(result, list):
+                        for page_result in result:
+                            if 'markdown' in page_result:
+                                content = page_result['markdown']
+                                page_url = page_result.get('url', base_url)
+                                
+                                extracted_tips = self.extract_tips_from_content(content, page_url, "hyperbrowser_crawl")
+                                tips.extend(extracted_tips)
+                        
+                        self._cache_put(cache_key, tips)
+                    
+                except Exception as e:
+                    logger.error(f"Error crawling {base_url} with Hyperbrowser: {e}")
+            
+            return tips
         
-        return tips
+        results = await asyncio.gather(*(crawl_site(base_url) for base_url in base_urls))
+        self._cache_save()
+        return [tip for site_tips in results for tip in site_tips]
     
     async def extract_structured_grow_data(self, urls: List[str]) -> List[Dict[str, Any]]:
         """Extract structured growing data using Hyperbrowser"""
@@ -228,6 +276,11 @@ class GrowTipScraper:
             }
         }
         
+        cache_key = JsonFileCache.key_for("extract_structured_grow_data", *urls)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         structured_data = []
         
         try:
@@ -239,12 +292,26 @@ class GrowTipScraper:
             
             if result:
                 structured_data.extend(result)
+                self._cache_put(cache_key, structured_data)
+                self._cache_save()
                 
         except Exception as e:
             logger.error(f"Error extracting structured data: {e}")
         
         return structured_data
     
+    def _cache_get(self, key: str) -> Optional[Any]:
+        return self.scrape_cache.get(key) if self.scrape_cache else None
+    
+    def _cache_put(self, key: str, value: Any):
+        # Empty results are usually a transient failure; don't hide real results for a day
+        if self.scrape_cache and value:
+            self.scrape_cache.put(key, value)
+    
+    def _cache_save(self):
+        if self.scrape_cache:
+            self.scrape_cache.save()
+    
     def extract_tips_from_content(self, content: str, source_url: str, scrape_type: str) -> List[Dict[str, Any]]:
         """Extract growing tips from scraped content"""
         tips = []
@@ -266,6 +333,8 @@ class GrowTipScraper:
                 }
                 tips.append(tip)
         
+        return tips
+    
     async def scrape_grow_forums(self) -> List[Dict[str, Any]]:
         """Main scraping function - enhanced with Hyperbrowser support"""
         if not self.session:
@@ -363,35 +432,29 @@ class GrowTipScraper:
         if not self.session:
             await self.setup_session()
         
-        all_tips = []
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
         
-        # Scrape forums with traditional methods
-        for forum_url in self.forum_urls:
-            try:
-                logger.info(f"Scraping forum: {forum_url}")
-                forum_tips = await self.scrape_forum(forum_url)
-                all_tips.extend(forum_tips)
-                
-                # Rate limiting
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error scraping forum {forum_url}: {e}")
-        
-        # Scrape blogs
-        for blog_url in self.blog_urls:
-            try:
-                logger.info(f"Scraping blog: {blog_url}")
-                blog_tips = await self.scrape_blog(blog_url)
-                all_tips.extend(blog_tips)
-                
-                # Rate limiting
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error scraping blog {blog_url}: {e}")
+        async def scrape_site(site_url: str, kind: str, scrape) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    logger.info(f"Scraping {kind}: {site_url}")
+                    site_tips = await scrape(site_url)
+                    
+                    # Rate limiting
+                    await asyncio.sleep(2)
+                    return site_tips
+                    
+                except Exception as e:
+                    logger.error(f"Error scraping {kind} {site_url}: {e}")
+                    return []
+        
+        # Every forum and blog is a different site, so they are scraped concurrently
+        results = await asyncio.gather(
+            *(scrape_site(forum_url, "forum", self.scrape_forum) for forum_url in self.forum_urls),
+            *(scrape_site(blog_url, "blog", self.scrape_blog) for blog_url in self.blog_urls)
+        )
         
-        return all_tips
+        return [tip for site_tips in results for tip in site_tips]
     
     def deduplicate_tips(self, tips: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate tips based on content similarity"""
@@ -648,9 +711,8 @@ class GrowTipScraper:
                 tip_copy['query_relevance'] = self.calculate_query_relevance(query, tip['content'])
                 relevant_tips.append(tip_copy)
         
-        # Sort by relevance and return top results
-        relevant_tips.sort(key=lambda x: x.get('query_relevance', 0), reverse=True)
-        return relevant_tips[:10]
+        # Return top results by relevance without sorting the whole list
+        return nlargest(10, relevant_tips, key=lambda x: x.get('query_relevance', 0))
     
     def calculate_query_relevance(self, query: str, content: str) -> float:
         """Calculate how relevant content is to a specific query"""
@@ -665,23 +727,15 @@ class GrowTipScraper:
     
     async def save_scraped_data(self):
         """Save scraped data to file"""
-        try:
-            os.makedirs("data", exist_ok=True)
-            
-            with open("data/scraped_tips.json", "w") as f:
-                json.dump(self.scraped_data, f, indent=2)
-            
+        # safe_json_save serializes with orjson when available and logs its own errors
+        if safe_json_save(self.scraped_data, "data/scraped_tips.json"):
             logger.info(f"Saved {len(self.scraped_data)} scraped tips to file")
-            
-        except Exception as e:
-            logger.error(f"Error saving scraped data: {e}")
     
     async def load_scraped_data(self):
         """Load previously scraped data from file"""
         try:
             if os.path.exists("data/scraped_tips.json"):
-                with open("data/scraped_tips.json", "r") as f:
-                    self.scraped_data = json.load(f)
+                self.scraped_data = safe_json_load("data/scraped_tips.json", default=[])
                 
                 logger.info(f"Loaded {len(self.scraped_data)} scraped tips from file")
             
@@ -692,6 +746,13 @@ class GrowTipScraper:
         """Clean up resources"""
         if self.driver:
             self.driver.quit()
+    
+    async def close(self):
+        """Close the HTTP session (if this scraper created it) and other resources"""
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+            self.session = None
+        self.cleanup()
 
 # Legacy function for compatibility with your notes
 def scrape_grow_forums():
@@ -717,7 +778,7 @@ if __name__ == "__main__":
                     print(f"- {tip['content'][:100]}...")
             
         finally:
-            scraper.cleanup()
+            await scraper.close()
     
     # Run the example
     asyncio.run(main())
\ No newline at end of file
@@ -109,6 +109,12 @@ def identify_strain_from_image():
                 # Perform strain identification
                 result = identifier.identify_strain(temp_path, top_k=top_k)
                 
+                if result.get('error') == 'no-plant-detected':
+                    return jsonify({
+                        'success': False,
+                        'error': 'No cannabis plant detected in image'
+                    }), 422
+                
                 if 'error' in result:
                     return jsonify({
                         'success': False,
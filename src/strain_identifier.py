@@ -5,11 +5,10 @@ AI-powered strain identification from bud images
 Extends the existing plant classifier for strain-specific recognition
 """
 
+import io
 import os
+import re
 import json
-import torch
-import torch.nn as nn
-from torchvision import transforms, models
 from PIL import Image
 import cv2
 import numpy as np
@@ -18,22 +17,288 @@ from loguru import logger
 import hashlib
 from pathlib import Path
 import pickle
+import tempfile
+from collections import OrderedDict
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .utils import user_cache_dir
+except ImportError:
+    from utils import user_cache_dir
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit, prange, set_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("Numba not available, falling back to scikit-image LBP")
+
+# Long-edge size (px) that images are reduced to before feature analysis.
+# Color percentages, LBP histograms and contour shape are scale-invariant
+# summaries, so there is no need to scan every full-resolution pixel.
+ANALYSIS_MAX_SIDE = 256
+
+# Bundled strain data, searched in order when no explicit path is given
+_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+_STRAIN_DATA_FILES = (
+    'enhanced_strains_v2_635_20250805_104847.json',
+    'final_reconstructed_strains.json',
+    'enhanced_strains_1500.json',
+    'strain_database.json',
+)
+
+# Below these, the image is treated as not showing a plant and scoring is skipped.
+# MIN_BUD_AREA is in analysis pixels (long edge ANALYSIS_MAX_SIDE), so the cutoff
+# is the same fraction of the frame at any input resolution
+MIN_PLANT_COLOR_PERCENTAGE = 5
+MIN_BUD_AREA = 50
+
+# Extracted features are cached by SHA-1 of the image bytes, in memory and on disk.
+# Bump FEATURE_CACHE_VERSION whenever the feature analysis changes its output
+FEATURE_CACHE_DIR = user_cache_dir('strain_features')
+FEATURE_CACHE_VERSION = 3
+FEATURE_CACHE_SIZE = 256
+FEATURE_CACHE_MAX_FILES = 4096
+FEATURE_CACHE_PRUNE_INTERVAL = 64
+
+# Strain THC values such as "21%" (ranges like "17-24%" are not used for scoring)
+_THC_PERCENT_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*%\s*$')
+
+# Columns of the precomputed per-strain prior table
+STRAIN_COL_THC, STRAIN_COL_INDICA, STRAIN_COL_SATIVA, STRAIN_COL_HYBRID = range(4)
+
+# Local Binary Pattern parameters used for texture analysis
+LBP_RADIUS = 3
+LBP_POINTS = 8 * LBP_RADIUS
+
+
+def _lbp_offsets(radius: int, n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Circular sampling offsets (row, col), matching scikit-image's layout"""
+    angles = 2 * np.pi * np.arange(n_points) / n_points
+    rows = np.round(-radius * np.sin(angles), 5)
+    cols = np.round(radius * np.cos(angles), 5)
+    return rows, cols
+
+
+_LBP_OFFSETS = _lbp_offsets(LBP_RADIUS, LBP_POINTS)
+
+
+def _strain_priors(strain_data: Dict[str, Any]) -> np.ndarray:
+    """Prior row for one strain: THC % (NaN when unknown) and strain type one-hot"""
+    row = np.zeros(4, dtype=np.float32)
+    
+    thc_match = _THC_PERCENT_RE.match(str(strain_data.get('thc_content') or ''))
+    row[STRAIN_COL_THC] = float(thc_match.group(1)) if thc_match else np.nan
+    
+    strain_type = str(strain_data.get('strain_type', 'hybrid')).lower()
+    if strain_type == 'indica':
+        row[STRAIN_COL_INDICA] = 1
+    elif strain_type == 'sativa':
+        row[STRAIN_COL_SATIVA] = 1
+    else:
+        row[STRAIN_COL_HYBRID] = 1
+    
+    return row
+
+
+def _feature_query(features: Dict[str, Any]) -> np.ndarray:
+    """Bind the scoring inputs once; NaN marks features that were not extracted"""
+    return np.array([
+        features.get('green_percentage', np.nan),
+        features.get('purple_percentage', 0),
+        features.get('trichome_density', 0),
+        features.get('texture_contrast', np.nan),
+        features.get('circularity', np.nan),
+    ], dtype=np.float32)
+
+
+def _score_strain_priors(query: np.ndarray, priors: np.ndarray) -> np.ndarray:
+    """Weighted color/THC/texture/shape similarity of one query against each prior row"""
+    green, purple, trichome_density, contrast, circularity = query
+    similarity = np.zeros(len(priors), dtype=np.float32)
+    total_weight = np.zeros(len(priors), dtype=np.float32)
+    
+    # Color-based similarity (weight: 0.4)
+    # Indica strains typically have darker, more purple hues, sativa strains
+    # brighter, more green hues; hybrids have a balanced color profile
+    if not np.isnan(green):
+        indica_score = (purple * 0.6 + (100 - green) * 0.4) / 100
+        sativa_score = (green * 0.6 + (100 - purple) * 0.4) / 100
+        hybrid_score = (green + purple) / 100
+        color_score = (priors[:, STRAIN_COL_INDICA] * indica_score +
+                       priors[:, STRAIN_COL_SATIVA] * sativa_score +
+                       priors[:, STRAIN_COL_HYBRID] * hybrid_score)
+        similarity += color_score * 0.4
+        total_weight += 0.4
+    
+    # THC content correlation (weight: 0.2), only for strains with a THC value.
+    # Higher THC often correlates with more trichomes
+    thc = priors[:, STRAIN_COL_THC]
+    has_thc = ~np.isnan(thc)
+    thc_score = 1.0 - np.abs(trichome_density - np.minimum(thc * 2, 100)) / 100
+    similarity += np.where(has_thc, np.maximum(thc_score, 0) * 0.2, 0)
+    total_weight += np.where(has_thc, np.float32(0.2), np.float32(0))
+    
+    # Texture similarity (weight: 0.3)
+    if not np.isnan(contrast):
+        similarity += min(contrast / 100, 1.0) * 0.3
+        total_weight += 0.3
+    
+    # Shape similarity (weight: 0.1), most buds have moderate circularity
+    if not np.isnan(circularity):
+        shape_score = 1.0 - abs(circularity - 0.6)
+        similarity += max(0, shape_score) * 0.1
+        total_weight += 0.1
+    
+    # Normalize final scores
+    return np.divide(similarity, total_weight,
+                     out=np.zeros_like(similarity), where=total_weight > 0)
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, ties kept in database order
+    
+    Same result as np.argsort(-scores, kind='stable')[:k], but only the
+    selected entries are sorted. Tied scores are common (same strain type,
+    no parseable THC), so the cutoff value is resolved explicitly rather
+    than leaving argpartition to pick an arbitrary subset of the ties.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        cutoff = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[:k - len(above)]
+        candidates = np.concatenate((above, tied))
+    else:
+        candidates = np.arange(k)
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _popcount(x):
+        count = 0
+        while x:
+            x &= x - 1
+            count += 1
+        return count
+
+    @njit(cache=True)
+    def _pixel(gray, r, c):
+        if r < 0 or c < 0 or r >= gray.shape[0] or c >= gray.shape[1]:
+            return 0.0
+        return float(gray[r, c])
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _lbp_uniform_counts(gray, row_offsets, col_offsets):
+        height, width = gray.shape
+        n_points = row_offsets.shape[0]
+        transition_mask = (1 << (n_points - 1)) - 1
+        row_counts = np.zeros((height, n_points + 2), dtype=np.int64)
+
+        for r in prange(height):
+            for c in range(width):
+                center = float(gray[r, c])
+                code = 0
+                for p in range(n_points):
+                    # Bilinear interpolation of the p-th neighbour
+                    y = r + row_offsets[p]
+                    x = c + col_offsets[p]
+                    y0 = int(np.floor(y))
+                    x0 = int(np.floor(x))
+                    y1 = int(np.ceil(y))
+                    x1 = int(np.ceil(x))
+                    dy = y - y0
+                    dx = x - x0
+                    top = (1 - dx) * _pixel(gray, y0, x0) + dx * _pixel(gray, y0, x1)
+                    bottom = (1 - dx) * _pixel(gray, y1, x0) + dx * _pixel(gray, y1, x1)
+                    if (1 - dy) * top + dy * bottom - center >= 0:
+                        code |= 1 << p
+
+                # Uniform patterns have at most two 0/1 changes between neighbours
+                changes = _popcount((code ^ (code >> 1)) & transition_mask)
+                if changes <= 2:
+                    row_counts[r, _popcount(code)] += 1
+                else:
+                    row_counts[r, n_points + 1] += 1
+
+        return row_counts.sum(axis=0)
+
+
+def lbp_uniform_hist(gray: np.ndarray, radius: int = LBP_RADIUS,
+                     n_points: int = LBP_POINTS) -> np.ndarray:
+    """Normalized histogram of uniform Local Binary Pattern codes"""
+    if not NUMBA_AVAILABLE:
+        from skimage.feature import local_binary_pattern
+        lbp = local_binary_pattern(gray, n_points, radius, method='uniform')
+        hist = cv2.calcHist([lbp.astype(np.uint8)], [0], None,
+                            [n_points + 2], [0, n_points + 2]).ravel()
+        return hist / max(hist.sum(), 1)
+
+    if radius == LBP_RADIUS and n_points == LBP_POINTS:
+        row_offsets, col_offsets = _LBP_OFFSETS
+    else:
+        row_offsets, col_offsets = _lbp_offsets(radius, n_points)
+
+    counts = _lbp_uniform_counts(np.ascontiguousarray(gray), row_offsets, col_offsets)
+    return counts / max(counts.sum(), 1)
+
+
+# Per-process identifier used by batch_identify_strains workers
+_worker_identifier = None
+
+
+def _init_identify_worker(init_kwargs: Dict[str, Any]):
+    """Process pool initializer: build one identifier per worker process"""
+    global _worker_identifier
+    # Each worker is already one of N processes; avoid OpenCV/Numba oversubscription
+    cv2.setNumThreads(1)
+    if NUMBA_AVAILABLE:
+        set_num_threads(1)
+    _worker_identifier = StrainIdentifier(**init_kwargs)
+
+
+def _identify_one(image_path: str) -> Dict[str, Any]:
+    """Identify a single image inside a worker process"""
+    return _worker_identifier.identify_strain(image_path)
+
 
 class StrainIdentifier:
-    def __init__(self, model_path: Optional[str] = None, strain_data_path: str = None):
-        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    def __init__(self, model_path: Optional[str] = None, strain_data_path: str = None,
+                 feature_cache_dir: Optional[str] = None):
+        # torch/torchvision are imported on first use; feature analysis doesn't need them
+        self._device = None
+        self._transform = None
         self.model = None
         self.strain_database = {}
         self.strain_classes = []
+        self._strain_matrix = np.empty((0, 4), dtype=np.float32)
+        self._strain_rows = {}
         self.feature_extractor = None
         self.simulation_mode = True  # Start in simulation mode
         
+        # Feature cache keyed by image content hash
+        self._feat_cache = OrderedDict()
+        self.feature_cache_dir = Path(feature_cache_dir) if feature_cache_dir else FEATURE_CACHE_DIR
+        self._feature_cache_writes = 0
+        
+        # Constructor arguments, so worker processes can rebuild an equivalent identifier
+        self._init_kwargs = {
+            'model_path': model_path,
+            'strain_data_path': strain_data_path,
+            'feature_cache_dir': str(self.feature_cache_dir),
+        }
+        
         # Load strain database
         self.load_strain_database(strain_data_path)
         
-        # Initialize feature extraction
-        self.transform = self._get_transform()
-        
         # Try to load pre-trained model
         if model_path and os.path.exists(model_path):
             self.load_model(model_path)
@@ -44,12 +309,7 @@ class StrainIdentifier:
         """Load strain database for reference"""
         try:
             # Try to load from enhanced strain files first
-            strain_files = [
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'enhanced_strains_v2_635_20250805_104847.json'),
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'final_reconstructed_strains.json'),
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'enhanced_strains_1500.json'),
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'strain_database.json')
-            ]
+            strain_files = [str(_DATA_DIR / name) for name in _STRAIN_DATA_FILES]
             
             # Use provided path if given
             if data_path:
@@ -59,24 +319,10 @@ class StrainIdentifier:
                 if os.path.exists(file_path):
                     logger.info(f"Loading strain database from: {file_path}")
                     
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Handle different data structures
-                    if isinstance(data, dict) and 'strains' in data:
-                        strains = data['strains']
-                    elif isinstance(data, list):
-                        strains = data
-                    else:
-                        strains = [data]
+                    self.strain_database.update(self._read_strain_file(file_path))
+                    self.strain_classes = list(self.strain_database)
                     
-                    # Build strain database
-                    for strain in strains:
-                        name = strain.get('name', '')
-                        if name:
-                            self.strain_database[name] = strain
-                            self.strain_classes.append(name)
-                            
+                    self._build_strain_matrix()
                     logger.info(f"Loaded {len(self.strain_database)} strains from database")
                     self.simulation_mode = False
                     return
@@ -91,6 +337,50 @@ class StrainIdentifier:
             self.simulation_mode = True
             self._create_simulation_database()
     
+    def _read_strain_file(self, file_path: str) -> Dict[str, Any]:
+        """Parse a strain JSON file, reusing a pickled copy while the source is unchanged"""
+        # One private cache entry per source path, valid for its current mtime and size
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cache_dir = self.feature_cache_dir / 'strain_db'
+        cache_path = cache_dir / f"{hashlib.sha1(file_path.encode()).hexdigest()}.pkl"
+        
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_path, cached_stamp, strain_database = pickle.load(f)
+                if cached_path == file_path and cached_stamp == stamp:
+                    return strain_database
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable strain cache {cache_path}: {e}")
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode('utf-8'))
+        
+        # Handle different data structures
+        if isinstance(data, dict) and 'strains' in data:
+            strains = data['strains']
+        elif isinstance(data, list):
+            strains = data
+        else:
+            strains = [data]
+        
+        # Build strain database (one entry per name, the last occurrence wins)
+        strain_database = {strain['name']: strain for strain in strains if strain.get('name')}
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+                pickle.dump((file_path, stamp, strain_database), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write strain cache {cache_path}: {e}")
+        
+        return strain_database
+
     def _create_simulation_database(self):
         """Create a simulation database with sample strains"""
         simulation_strains = [
@@ -120,14 +410,42 @@ class StrainIdentifier:
             }
         ]
         
-        for strain in simulation_strains:
-            self.strain_database[strain['name']] = strain
-            self.strain_classes.append(strain['name'])
-            
+        self.strain_database.update({strain['name']: strain for strain in simulation_strains})
+        self.strain_classes = list(self.strain_database)
+        
+        self._build_strain_matrix()
         logger.info(f"Created simulation database with {len(simulation_strains)} strains")
 
+    def _build_strain_matrix(self):
+        """Precompute per-strain priors (THC %, strain type one-hot) for vectorized scoring"""
+        if self.strain_classes:
+            self._strain_matrix = np.stack([
+                _strain_priors(self.strain_database.get(strain_name, {}))
+                for strain_name in self.strain_classes
+            ])
+        else:
+            self._strain_matrix = np.empty((0, 4), dtype=np.float32)
+        self._strain_rows = {name: row for row, name in enumerate(self.strain_classes)}
+
+    @property
+    def device(self):
+        """Torch device for model inference (imports torch on first access)"""
+        if self._device is None:
+            import torch
+            self._device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        return self._device
+
+    @property
+    def transform(self):
+        """Model preprocessing transforms (imports torchvision on first access)"""
+        if self._transform is None:
+            self._transform = self._get_transform()
+        return self._transform
+
     def _get_transform(self):
         """Get image preprocessing transforms optimized for strain identification"""
+        from torchvision import transforms
+        
         return transforms.Compose([
             transforms.Resize((224, 224)),
             transforms.ToTensor(),
@@ -138,39 +456,172 @@ class StrainIdentifier:
     def extract_visual_features(self, image_path: str) -> Dict[str, Any]:
         """Extract visual features specific to strain identification"""
         try:
-            # Load image with OpenCV for advanced analysis
-            img = cv2.imread(image_path)
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            # Read the file once; the same bytes feed the hash and the decoder
+            image_bytes = Path(image_path).read_bytes()
+            
+            cache_key = self._feature_cache_key(image_bytes)
+            cached = self._get_cached_features(cache_key)
+            if cached is not None:
+                return dict(cached)
+            
+            # Decode (at reduced resolution when possible) from the bytes read above
+            img_rgb, (width, height) = self._decode_image(image_bytes)
+            
+            # Downsample once and run every analyzer on the reduced copy
+            small = self._downsample(img_rgb)
+            gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
             
             features = {}
             
             # Color analysis - crucial for strain identification
-            features.update(self._analyze_colors(img_rgb))
+            features.update(self._analyze_colors(small))
             
             # Texture analysis - trichome density, bud structure
-            features.update(self._analyze_texture(img_rgb))
+            features.update(self._analyze_texture(small, gray))
             
-            # Shape analysis - bud density and structure
-            features.update(self._analyze_shape(img_rgb))
+            # Shape analysis - bud density and structure, reported in original pixels
+            scale = (width / small.shape[1], height / small.shape[0])
+            features.update(self._analyze_shape(small, gray, scale))
             
-            # Size analysis
+            # Size analysis (of the original, not the reduced decode)
             features['image_dimensions'] = {
-                'width': img_rgb.shape[1],
-                'height': img_rgb.shape[0]
+                'width': width,
+                'height': height
             }
             
-            return features
+            self._store_cached_features(cache_key, features)
+            return dict(features)
             
         except Exception as e:
             logger.error(f"Error extracting visual features: {e}")
             return {}
 
+    @staticmethod
+    def _feature_cache_key(image_bytes: bytes) -> str:
+        """Hash the image bytes together with everything that shapes the features"""
+        digest = hashlib.sha1(f"{FEATURE_CACHE_VERSION}:{ANALYSIS_MAX_SIDE}:"
+                              f"{LBP_RADIUS}:{LBP_POINTS}:".encode())
+        digest.update(image_bytes)
+        return digest.hexdigest()
+
+    def _get_cached_features(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up features in the in-memory LRU, then in the on-disk cache"""
+        if cache_key in self._feat_cache:
+            self._feat_cache.move_to_end(cache_key)
+            return self._feat_cache[cache_key]
+        
+        cache_file = self.feature_cache_dir / f"{cache_key}.pkl"
+        if not cache_file.exists():
+            return None
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                features = pickle.load(f)
+            # Refresh the mtime so pruning drops the least recently used entries
+            os.utime(cache_file)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feature cache entry {cache_file}: {e}")
+            return None
+        
+        self._remember_features(cache_key, features)
+        return features
+
+    def _store_cached_features(self, cache_key: str, features: Dict[str, Any]):
+        """Store features in the in-memory LRU and persist them to disk"""
+        self._remember_features(cache_key, features)
+        
+        try:
+            self.feature_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a private temp file and rename, batch workers share the directory
+            with tempfile.NamedTemporaryFile(dir=self.feature_cache_dir, suffix='.tmp',
+                                             delete=False) as f:
+                pickle.dump(features, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, self.feature_cache_dir / f"{cache_key}.pkl")
+        except Exception as e:
+            logger.warning(f"Could not write feature cache entry: {e}")
+            return
+        
+        self._feature_cache_writes += 1
+        if self._feature_cache_writes % FEATURE_CACHE_PRUNE_INTERVAL == 1:
+            self._prune_feature_cache()
+
+    def _prune_feature_cache(self, max_files: Optional[int] = None):
+        """Delete the least recently used on-disk entries beyond max_files"""
+        max_files = FEATURE_CACHE_MAX_FILES if max_files is None else max_files
+        try:
+            entries = []
+            for entry in os.scandir(self.feature_cache_dir):
+                if entry.name.endswith('.pkl'):
+                    entries.append((entry.stat().st_mtime, entry.path))
+            if len(entries) <= max_files:
+                return
+            entries.sort()
+            for _, path in entries[:len(entries) - max_files]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass  # Already pruned by another worker
+        except Exception as e:
+            logger.warning(f"Could not prune feature cache: {e}")
+
+    def _remember_features(self, cache_key: str, features: Dict[str, Any]):
+        """Insert into the in-memory LRU, evicting the oldest entry when full"""
+        self._feat_cache[cache_key] = features
+        self._feat_cache.move_to_end(cache_key)
+        if len(self._feat_cache) > FEATURE_CACHE_SIZE:
+            self._feat_cache.popitem(last=False)
+
+    def _decode_image(self, image_bytes: bytes) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """Decode image bytes to RGB, returning the pixels and the original (width, height)
+        
+        The header is probed with Pillow so OpenCV can decode at 1/2, 1/4 or 1/8
+        scale (done inside libjpeg for JPEGs) whenever the result still covers
+        ANALYSIS_MAX_SIDE. Pillow is also the decoder of last resort.
+        """
+        width = height = None
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as probe:
+                width, height = probe.size
+                # OpenCV applies EXIF rotation, Pillow's size does not
+                if probe.getexif().get(0x0112) in (5, 6, 7, 8):
+                    width, height = height, width
+        except Exception:
+            pass
+        
+        flag = cv2.IMREAD_COLOR
+        if width and height:
+            long_side = max(width, height)
+            for factor, reduced_flag in ((8, cv2.IMREAD_REDUCED_COLOR_8),
+                                         (4, cv2.IMREAD_REDUCED_COLOR_4),
+                                         (2, cv2.IMREAD_REDUCED_COLOR_2)):
+                if long_side // factor >= ANALYSIS_MAX_SIDE:
+                    flag = reduced_flag
+                    break
+        
+        img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), flag)
+        if img is not None:
+            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        else:
+            with Image.open(io.BytesIO(image_bytes)) as pil_img:
+                img_rgb = np.asarray(pil_img.convert('RGB'))
+        
+        if not (width and height):
+            height, width = img_rgb.shape[:2]
+        return img_rgb, (width, height)
+
+    def _downsample(self, img_rgb: np.ndarray, max_side: int = ANALYSIS_MAX_SIDE) -> np.ndarray:
+        """Shrink an image so its long edge is at most ``max_side`` pixels"""
+        height, width = img_rgb.shape[:2]
+        scale = max_side / max(height, width)
+        if scale >= 1:
+            return img_rgb
+        return cv2.resize(img_rgb, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
     def _analyze_colors(self, img_rgb: np.ndarray) -> Dict[str, Any]:
         """Analyze color characteristics for strain identification"""
         try:
-            # Convert to different color spaces
+            # Convert to HSV for hue-based masks
             hsv = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2HSV)
-            lab = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2LAB)
             
             # Calculate color statistics
             rgb_mean = np.mean(img_rgb, axis=(0, 1))
@@ -205,34 +656,26 @@ class StrainIdentifier:
             logger.error(f"Error in color analysis: {e}")
             return {}
 
-    def _analyze_texture(self, img_rgb: np.ndarray) -> Dict[str, Any]:
+    def _analyze_texture(self, img_rgb: np.ndarray, gray: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Analyze texture for trichome density and bud structure"""
         try:
             # Convert to grayscale for texture analysis
-            gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
+            if gray is None:
+                gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
             
             # Calculate texture features using Local Binary Patterns
-            from skimage.feature import local_binary_pattern
-            
-            # LBP parameters
-            radius = 3
-            n_points = 8 * radius
-            lbp = local_binary_pattern(gray, n_points, radius, method='uniform')
-            
-            # Calculate LBP histogram
-            lbp_hist, _ = np.histogram(lbp.ravel(), bins=n_points + 2, 
-                                     range=(0, n_points + 2), density=True)
+            lbp_hist = lbp_uniform_hist(gray)
             
             # Edge detection for structure analysis
             edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.sum(edges > 0) / edges.size
+            edge_density = cv2.countNonZero(edges) / edges.size
             
             # Texture contrast using GLCM approximation
             contrast = np.std(gray)
             
             # Detect potential trichomes (bright spots)
             _, bright_spots = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY)
-            trichome_density = np.sum(bright_spots > 0) / bright_spots.size * 100
+            trichome_density = cv2.countNonZero(bright_spots) / bright_spots.size * 100
             
             return {
                 'lbp_histogram': lbp_hist.tolist(),
@@ -246,22 +689,38 @@ class StrainIdentifier:
             logger.error(f"Error in texture analysis: {e}")
             return {}
 
-    def _analyze_shape(self, img_rgb: np.ndarray) -> Dict[str, Any]:
-        """Analyze bud shape and structure"""
+    def _analyze_shape(self, img_rgb: np.ndarray, gray: Optional[np.ndarray] = None,
+                       scale: Tuple[float, float] = (1.0, 1.0)) -> Dict[str, Any]:
+        """Analyze bud shape and structure
+        
+        ``scale`` is original pixels per analysed pixel along (x, y). Area,
+        perimeter and bounding box are scaled back to the original image, and
+        ``analysis_scale`` records the linear factor used.
+        """
+        scale_x, scale_y = scale
+        analysis_scale = float(np.sqrt(scale_x * scale_y))
         try:
             # Convert to grayscale and apply threshold
-            gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
+            if gray is None:
+                gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
             _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
-            # Find contours
-            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            # Featureless image - nothing worth tracing
+            if cv2.countNonZero(binary) < 100:
+                contours = []
+            else:
+                contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
             if contours:
-                # Get largest contour (main bud)
-                largest_contour = max(contours, key=cv2.contourArea)
+                # Get largest contour (main bud), keeping its area for reuse
+                largest_contour = None
+                area = -1.0
+                for contour in contours:
+                    contour_area = cv2.contourArea(contour)
+                    if contour_area > area:
+                        largest_contour, area = contour, contour_area
                 
                 # Calculate shape features
-                area = cv2.contourArea(largest_contour)
                 perimeter = cv2.arcLength(largest_contour, True)
                 
                 # Circularity (4π*area/perimeter²)
@@ -277,35 +736,40 @@ class StrainIdentifier:
                 solidity = area / hull_area if hull_area > 0 else 0
                 
                 return {
-                    'bud_area': area,
-                    'bud_perimeter': perimeter,
+                    'bud_area': area * scale_x * scale_y,
+                    'bud_perimeter': perimeter * analysis_scale,
                     'circularity': circularity,
                     'aspect_ratio': aspect_ratio,
                     'solidity': solidity,
-                    'bounding_box': [x, y, w, h]
+                    'bounding_box': [round(x * scale_x), round(y * scale_y),
+                                     round(w * scale_x), round(h * scale_y)],
+                    'analysis_scale': analysis_scale
                 }
             else:
                 return {'bud_area': 0, 'bud_perimeter': 0, 'circularity': 0, 
-                       'aspect_ratio': 0, 'solidity': 0, 'bounding_box': [0, 0, 0, 0]}
+                       'aspect_ratio': 0, 'solidity': 0, 'bounding_box': [0, 0, 0, 0],
+                       'analysis_scale': analysis_scale}
                 
         except Exception as e:
             logger.error(f"Error in shape analysis: {e}")
             return {}
 
     def _get_dominant_colors(self, img_rgb: np.ndarray, k: int = 5) -> List[List[int]]:
-        """Extract dominant colors using K-means clustering"""
+        """Extract dominant colors from a 4-bit-per-channel color histogram"""
         try:
-            # Reshape image to be a list of pixels
-            data = img_rgb.reshape((-1, 3))
-            data = np.float32(data)
+            # Quantize each channel to 16 levels and pack into a 12-bit bucket index
+            q = (img_rgb >> 4).astype(np.uint16)
+            idx = (q[..., 0] << 8) | (q[..., 1] << 4) | q[..., 2]
+            counts = np.bincount(idx.ravel(), minlength=4096)
             
-            # Apply K-means
-            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 20, 1.0)
-            _, labels, centers = cv2.kmeans(data, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
+            # Most populated buckets, most frequent first
+            k = min(k, np.count_nonzero(counts))
+            top = np.argpartition(counts, -k)[-k:]
+            top = top[np.argsort(counts[top])[::-1]]
             
-            # Convert back to uint8 and return
-            centers = np.uint8(centers)
-            return centers.tolist()
+            # Unpack bucket indices back to RGB (bucket midpoints)
+            centers = np.stack([top >> 8, (top >> 4) & 0xF, top & 0xF], axis=1) * 16 + 8
+            return centers.astype(np.uint8).tolist()
             
         except Exception as e:
             logger.error(f"Error extracting dominant colors: {e}")
@@ -314,79 +778,22 @@ class StrainIdentifier:
     def calculate_strain_similarity(self, features: Dict[str, Any], strain_name: str) -> float:
         """Calculate similarity between extracted features and known strain characteristics"""
         try:
-            strain_data = self.strain_database.get(strain_name, {})
-            
-            similarity_score = 0.0
-            total_weight = 0.0
-            
-            # Color-based similarity (weight: 0.4)
-            color_weight = 0.4
-            if 'green_percentage' in features:
-                # Indica strains typically have darker, more purple hues
-                # Sativa strains typically have brighter, more green hues
-                strain_type = strain_data.get('strain_type', 'hybrid').lower()
-                
-                if strain_type == 'indica':
-                    # Indica preference: more purple, less bright green
-                    color_score = (features.get('purple_percentage', 0) * 0.6 + 
-                                 (100 - features.get('green_percentage', 50)) * 0.4) / 100
-                elif strain_type == 'sativa':
-                    # Sativa preference: more green, less purple
-                    color_score = (features.get('green_percentage', 50) * 0.6 + 
-                                 (100 - features.get('purple_percentage', 0)) * 0.4) / 100
-                else:  # hybrid
-                    # Balanced color profile
-                    color_score = (features.get('green_percentage', 50) + 
-                                 features.get('purple_percentage', 0)) / 100
-                
-                similarity_score += color_score * color_weight
-                total_weight += color_weight
-            
-            # THC content correlation (weight: 0.2)
-            thc_weight = 0.2
-            strain_thc = strain_data.get('thc_content', '')
-            if strain_thc and '%' in strain_thc:
-                try:
-                    thc_value = float(strain_thc.replace('%', ''))
-                    # Higher THC often correlates with more trichomes
-                    trichome_density = features.get('trichome_density', 0)
-                    expected_trichomes = min(thc_value * 2, 100)  # Rough correlation
-                    thc_score = 1.0 - abs(trichome_density - expected_trichomes) / 100
-                    similarity_score += max(0, thc_score) * thc_weight
-                    total_weight += thc_weight
-                except:
-                    pass
-            
-            # Texture similarity (weight: 0.3)
-            texture_weight = 0.3
-            if 'texture_contrast' in features:
-                # Different strains have different bud densities
-                contrast = features.get('texture_contrast', 0)
-                # Normalize contrast score
-                texture_score = min(contrast / 100, 1.0)
-                similarity_score += texture_score * texture_weight
-                total_weight += texture_weight
-            
-            # Shape similarity (weight: 0.1)
-            shape_weight = 0.1
-            if 'circularity' in features:
-                circularity = features.get('circularity', 0)
-                # Most cannabis buds have moderate circularity
-                ideal_circularity = 0.6
-                shape_score = 1.0 - abs(circularity - ideal_circularity)
-                similarity_score += max(0, shape_score) * shape_weight
-                total_weight += shape_weight
-            
-            # Normalize final score
-            if total_weight > 0:
-                return similarity_score / total_weight
+            row = self._strain_rows.get(strain_name)
+            if row is not None:
+                priors = self._strain_matrix[row:row + 1]
             else:
-                return 0.0
+                priors = _strain_priors(self.strain_database.get(strain_name, {}))[np.newaxis]
+            
+            return float(_score_strain_priors(_feature_query(features), priors)[0])
                 
         except Exception as e:
             logger.error(f"Error calculating similarity for {strain_name}: {e}")
             return 0.0
 
+    def score_all_strains(self, features: Dict[str, Any]) -> np.ndarray:
+        """Vectorized calculate_strain_similarity over every strain in strain_classes"""
+        return _score_strain_priors(_feature_query(features), self._strain_matrix)
+
     def identify_strain(self, image_path: str, top_k: int = 5) -> Dict[str, Any]:
         """Main strain identification function"""
         try:
@@ -401,20 +808,25 @@ class StrainIdentifier:
             if not features:
                 return {'error': 'Failed to extract visual features from image'}
             
-            # Calculate similarity scores for all strains
-            strain_scores = []
-            
-            for strain_name in self.strain_classes:
-                similarity = self.calculate_strain_similarity(features, strain_name)
-                strain_scores.append({
-                    'strain_name': strain_name,
-                    'confidence': similarity,
-                    'strain_data': self.strain_database.get(strain_name, {})
-                })
-            
-            # Sort by confidence and get top results
-            strain_scores.sort(key=lambda x: x['confidence'], reverse=True)
-            top_matches = strain_scores[:top_k]
+            # Similarity is meaningless without plant colors or a bud outline
+            plant_color = features.get('green_percentage', 0) + features.get('purple_percentage', 0)
+            analysis_area = features.get('bud_area', 0) / features.get('analysis_scale', 1.0) ** 2
+            if plant_color < MIN_PLANT_COLOR_PERCENTAGE or analysis_area < MIN_BUD_AREA:
+                logger.info(f"No plant detected in image: {image_path}")
+                return {'error': 'no-plant-detected', 'visual_features': features}
+            
+            # Calculate similarity scores for all strains at once
+            scores = self.score_all_strains(features)
+            
+            top_indices = _top_k_indices(scores, top_k)
+            top_matches = [
+                {
+                    'strain_name': self.strain_classes[i],
+                    'confidence': float(scores[i]),
+                    'strain_data': self.strain_database.get(self.strain_classes[i], {})
+                }
+                for i in top_indices
+            ]
             
             # Prepare result
             result = {
@@ -438,8 +850,8 @@ class StrainIdentifier:
             logger.error(f"Error identifying strain: {e}")
             return {'error': str(e)}
 
-    def batch_identify_strains(self, image_directory: str) -> Dict[str, Any]:
-        """Identify strains for all images in a directory"""
+    def batch_identify_strains(self, image_directory: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Identify strains for all images in a directory using a process pool"""
         try:
             image_dir = Path(image_directory)
             if not image_dir.exists():
@@ -457,22 +869,36 @@ class StrainIdentifier:
                 'results': {}
             }
             
-            for image_file in image_files:
-                try:
-                    result = self.identify_strain(str(image_file))
-                    results['results'][image_file.name] = result
-                    
-                    if 'error' not in result:
-                        results['successful_identifications'] += 1
-                    else:
+            if not image_files:
+                return results
+            
+            # Feature extraction is CPU-bound and independent per image;
+            # never start more workers than there are images
+            workers = min(max_workers or os.cpu_count() or 1, len(image_files))
+            # spawn, not fork: OpenCV and Numba thread pools are not fork-safe
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_identify_worker,
+                                     initargs=(self._init_kwargs,)) as executor:
+                futures = [(image_file, executor.submit(_identify_one, str(image_file)))
+                           for image_file in image_files]
+                
+                for image_file, future in futures:
+                    try:
+                        result = future.result()
+                        results['results'][image_file.name] = result
+                        
+                        if 'error' not in result:
+                            results['successful_identifications'] += 1
+                        else:
+                            results['failed_identifications'] += 1
+                        
+                        results['processed_images'] += 1
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing {image_file}: {e}")
                         results['failed_identifications'] += 1
-                    
-                    results['processed_images'] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {image_file}: {e}")
-                    results['failed_identifications'] += 1
-                    results['processed_images'] += 1
+                        results['processed_images'] += 1
             
             return results
             
@@ -483,8 +909,13 @@ class StrainIdentifier:
     def save_identification_results(self, results: Dict[str, Any], output_file: str):
         """Save identification results to JSON file"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+            if ORJSON_AVAILABLE:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(results, default=str,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
             logger.info(f"Results saved to: {output_file}")
         except Exception as e:
             logger.error(f"Error saving results: {e}")
@@ -7,13 +7,68 @@ import os
 import json
 import time
 import hashlib
+import mmap
+import random
 import asyncio
+import functools
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Set, Union
 from pathlib import Path
 import re
+import sys
+import tempfile
+from collections import deque
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Common stop words skipped by extract_keywords
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
+    'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+
+# Words are runs of \w. ASCII text takes the fast path of blanking every ASCII
+# non-word character and splitting; anything else (curly quotes, dashes,
+# ellipses) goes through the regex
+_ASCII_NONWORD = ''.join(c for c in map(chr, range(128)) if not (c.isalnum() or c == '_'))
+_ASCII_NONWORD_TABLE = str.maketrans(_ASCII_NONWORD, ' ' * len(_ASCII_NONWORD))
+_WORD_RE = re.compile(r'\w+')
+
+# Precompiled text/duration patterns
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?-]')
+_DUR_RE = re.compile(r'(\d+(?:\.\d+)?)([smhdw])')
+
+# Expected ranges for sensors
+SENSOR_RANGES = {
+    'temperature': (-50, 100),  # Celsius
+    'humidity': (0, 100),       # Percentage
+    'soil_moisture': (0, 100),  # Percentage
+    'co2': (0, 5000),          # PPM
+}
+
+# Units for format_file_size, one per power of 1024
+FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# File hashing (local integrity only, not security)
+FILE_HASH_ALGORITHM = 'blake2b'
+FILE_HASH_CHUNK_SIZE = 1 << 20
+FILE_HASH_MMAP_THRESHOLD = 1 << 20
+
 def ensure_directory(path: Union[str, Path]) -> Path:
     """Ensure directory exists, create if it doesn't
     
@@ -27,6 +82,23 @@ def ensure_directory(path: Union[str, Path]) -> Path:
     path_obj.mkdir(parents=True, exist_ok=True)
     return path_obj
 
+def user_cache_dir(*parts: str) -> Path:
+    """Get the per-user GrowWiz cache directory (not created)
+    
+    Uses XDG_CACHE_HOME when set, LOCALAPPDATA on Windows, else ~/.cache.
+    
+    Args:
+        *parts: Subdirectories below the GrowWiz cache root
+        
+    Returns:
+        Path object
+    """
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base and sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA')
+    root = Path(base) if base else Path.home() / '.cache'
+    return root.joinpath('growwiz', *parts)
+
 def get_timestamp() -> float:
     """Get current timestamp"""
     return time.time()
@@ -44,20 +116,34 @@ def format_timestamp(timestamp: float, format_str: str = "%Y-%m-%d %H:%M:%S") ->
     return datetime.fromtimestamp(timestamp).strftime(format_str)
 
 def get_file_hash(file_path: Union[str, Path]) -> str:
-    """Get MD5 hash of file
+    """Get BLAKE2b hash of file
     
     Args:
         file_path: Path to file
         
     Returns:
-        MD5 hash string
+        BLAKE2b hash string
     """
-    hash_md5 = hashlib.md5()
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= FILE_HASH_MMAP_THRESHOLD:
+                # Hash straight from the page cache, no per-chunk bytes copies
+                file_hash = hashlib.new(FILE_HASH_ALGORITHM)
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    file_hash.update(mm)
+                return file_hash.hexdigest()
+            
+            if sys.version_info >= (3, 11):
+                # C-level read loop that releases the GIL
+                return hashlib.file_digest(f, FILE_HASH_ALGORITHM).hexdigest()
+            
+            file_hash = hashlib.new(FILE_HASH_ALGORITHM)
+            for chunk in iter(lambda: f.read(FILE_HASH_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+            return file_hash.hexdigest()
     except Exception as e:
         logger.error(f"Error hashing file {file_path}: {e}")
         return ""
@@ -73,31 +159,42 @@ def safe_json_load(file_path: Union[str, Path], default: Any = None) -> Any:
         Loaded JSON data or default
     """
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(Path(file_path).read_bytes())
         with open(file_path, 'r') as f:
             return json.load(f)
     except Exception as e:
         logger.warning(f"Error loading JSON from {file_path}: {e}")
         return default
 
-def safe_json_save(data: Any, file_path: Union[str, Path]) -> bool:
+def safe_json_save(data: Any, file_path: Union[str, Path], pretty: bool = True) -> bool:
     """Safely save data to JSON file
     
     Args:
         data: Data to save
         file_path: Path to save file
+        pretty: Indent the output; pass False for large machine-read files
         
     Returns:
         True if successful, False otherwise
     """
     try:
         ensure_directory(Path(file_path).parent)
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        Path(file_path).write_bytes(_json_dumps(data, pretty))
         return True
     except Exception as e:
         logger.error(f"Error saving JSON to {file_path}: {e}")
         return False
 
+def _json_dumps(data: Any, pretty: bool = True) -> bytes:
+    """Serialize data to JSON bytes, stringifying unsupported types"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, default=str, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode()
+    return json.dumps(data, separators=(',', ':'), default=str).encode()
+
 def clean_text(text: str) -> str:
     """Clean and normalize text
     
@@ -111,13 +208,19 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace
-    text = re.sub(r'\\s+', ' ', text.strip())
+    text = _WS_RE.sub(' ', text.strip())
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\\w\\s.,!?-]', '', text)
+    text = _SPECIAL_CHARS_RE.sub('', text)
     
     return text
 
+def _split_words(text: str) -> List[str]:
+    """Split already-lowercased text into runs of word characters"""
+    if text.isascii():
+        return text.translate(_ASCII_NONWORD_TABLE).split()
+    return _WORD_RE.findall(text)
+
 def extract_keywords(text: str, min_length: int = 3) -> List[str]:
     """Extract keywords from text
     
@@ -131,40 +234,24 @@ def extract_keywords(text: str, min_length: int = 3) -> List[str]:
     if not text:
         return []
     
-    # Common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-        'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-        'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
-        'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
-    }
-    
-    # Extract words
-    words = re.findall(r'\\b\\w+\\b', text.lower())
+    words = _split_words(text.lower())
     
-    # Filter keywords
-    keywords = [
-        word for word in words 
-        if len(word) >= min_length and word not in stop_words
-    ]
-    
-    # Remove duplicates while preserving order
+    # Filter and remove duplicates in one pass, preserving order
     seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
-    
-    return unique_keywords
+    seen_add = seen.add
+    return [
+        word for word in words
+        if len(word) >= min_length and word not in STOP_WORDS
+        and word not in seen and not seen_add(word)
+    ]
 
-def calculate_similarity(text1: str, text2: str) -> float:
+def calculate_similarity(text1: str, text2: str, index: Optional['KeywordIndex'] = None) -> float:
     """Calculate text similarity using simple word overlap
     
     Args:
         text1: First text
         text2: Second text
+        index: Optional shared vocabulary; only its keywords are compared
         
     Returns:
         Similarity score (0.0 to 1.0)
@@ -172,16 +259,48 @@ def calculate_similarity(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     
-    words1 = set(extract_keywords(text1))
-    words2 = set(extract_keywords(text2))
+    if index is not None:
+        return _jaccard(frozenset(index.find(text1)), frozenset(index.find(text2)))
     
-    if not words1 or not words2:
+    return _jaccard(_keywordset(text1), _keywordset(text2))
+
+@functools.lru_cache(maxsize=4096)
+def _keywordset(text: str) -> frozenset:
+    """Keyword set for text, cached so repeated comparisons tokenize once"""
+    return frozenset(extract_keywords(text))
+
+def _jaccard(set1: frozenset, set2: frozenset) -> float:
+    """Jaccard overlap of two keyword sets"""
+    if not set1 or not set2:
         return 0.0
     
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    return len(set1 & set2) / len(set1 | set2)
+
+def calculate_similarity_precomputed(set1: frozenset, set2: frozenset) -> float:
+    """Calculate similarity between keyword sets that were already extracted
     
-    return len(intersection) / len(union) if union else 0.0
+    Args:
+        set1: First keyword set
+        set2: Second keyword set
+        
+    Returns:
+        Similarity score (0.0 to 1.0)
+    """
+    return _jaccard(set1, set2)
+
+def batch_similarity(texts: List[str]) -> List[List[float]]:
+    """Calculate pairwise similarity for a list of texts
+    
+    Each text is tokenized once rather than once per pair.
+    
+    Args:
+        texts: Texts to compare
+        
+    Returns:
+        NxN matrix of similarity scores (0.0 to 1.0)
+    """
+    sets = [_keywordset(text) if text else frozenset() for text in texts]
+    return [[_jaccard(a, b) for b in sets] for a in sets]
 
 def validate_sensor_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate and clean sensor data
@@ -194,21 +313,13 @@ def validate_sensor_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     validated = {}
     
-    # Expected ranges for sensors
-    ranges = {
-        'temperature': (-50, 100),  # Celsius
-        'humidity': (0, 100),       # Percentage
-        'soil_moisture': (0, 100),  # Percentage
-        'co2': (0, 5000),          # PPM
-    }
-    
     for key, value in data.items():
         if key == 'timestamp':
             validated[key] = value
             continue
         
-        if key in ranges:
-            min_val, max_val = ranges[key]
+        if key in SENSOR_RANGES:
+            min_val, max_val = SENSOR_RANGES[key]
             
             # Convert to float if possible
             try:
@@ -229,6 +340,51 @@ def validate_sensor_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     return validated
 
+def _sensor_float(value: Any) -> float:
+    """Convert a raw sensor value to float, NaN if it isn't numeric"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float('nan')
+
+def validate_sensor_data_batch(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate and clean many sensor readings at once
+    
+    Range checks run as one NumPy pass per sensor instead of per value.
+    Single rows go through validate_sensor_data.
+    
+    Args:
+        rows: Raw sensor data rows
+        
+    Returns:
+        Validated sensor data rows
+    """
+    if len(rows) <= 1:
+        return [validate_sensor_data(row) for row in rows]
+    
+    import numpy as np
+    
+    validated = [dict(row) for row in rows]
+    
+    for key, (min_val, max_val) in SENSOR_RANGES.items():
+        indices = [i for i, row in enumerate(rows) if key in row]
+        if not indices:
+            continue
+        
+        values = np.fromiter((_sensor_float(rows[i][key]) for i in indices),
+                             dtype=np.float64, count=len(indices))
+        mask = (values >= min_val) & (values <= max_val)
+        
+        rejected = len(indices) - int(mask.sum())
+        if rejected:
+            logger.warning(f"{rejected} sensor {key} values invalid or out of range [{min_val}, {max_val}]")
+        
+        # Python's round keeps results identical to validate_sensor_data
+        for i, ok, value in zip(indices, mask.tolist(), values.tolist()):
+            validated[i][key] = round(value, 2) if ok else None
+    
+    return validated
+
 def format_sensor_data(data: Dict[str, Any]) -> str:
     """Format sensor data for display
     
@@ -258,7 +414,7 @@ def format_sensor_data(data: Dict[str, Any]) -> str:
     if 'co2' in data and data['co2'] is not None:
         lines.append(f"CO2: {data['co2']} ppm")
     
-    return "\\n".join(lines)
+    return "\n".join(lines)
 
 def get_file_size(file_path: Union[str, Path]) -> int:
     """Get file size in bytes
@@ -283,26 +439,29 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
+    # Every 10 bits of magnitude is one 1024x unit step
+    i = min(len(FILE_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
     
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {FILE_SIZE_UNITS[i]}"
+
+def _backoff_delay(attempt: int, delay: float, max_delay: float, jitter: float) -> float:
+    """Exponential backoff for a retry attempt, capped, plus random jitter"""
+    return min(max_delay, delay * (2 ** attempt)) + random.uniform(0, jitter)
 
-def retry_async(max_retries: int = 3, delay: float = 1.0):
+def retry_async(max_retries: int = 3, delay: float = 1.0, max_delay: float = 30.0, jitter: float = 0.5):
     """Decorator for retrying async functions
     
     Args:
         max_retries: Maximum number of retries
-        delay: Delay between retries in seconds
+        delay: Initial delay between retries in seconds, doubled per attempt
+        max_delay: Upper bound on the backoff delay in seconds
+        jitter: Maximum random seconds added to each delay
     """
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             last_exception = None
             
@@ -313,23 +472,27 @@ def retry_async(max_retries: int = 3, delay: float = 1.0):
                     last_exception = e
                     if attempt < max_retries:
                         logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}")
-                        await asyncio.sleep(delay)
+                        await asyncio.sleep(_backoff_delay(attempt, delay, max_delay, jitter))
                     else:
                         logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
             
-            raise last_exception
+            if last_exception is not None:
+                raise last_exception
         
         return wrapper
     return decorator
 
-def retry_sync(max_retries: int = 3, delay: float = 1.0):
+def retry_sync(max_retries: int = 3, delay: float = 1.0, max_delay: float = 30.0, jitter: float = 0.5):
     """Decorator for retrying sync functions
     
     Args:
         max_retries: Maximum number of retries
-        delay: Delay between retries in seconds
+        delay: Initial delay between retries in seconds, doubled per attempt
+        max_delay: Upper bound on the backoff delay in seconds
+        jitter: Maximum random seconds added to each delay
     """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
             
@@ -340,18 +503,22 @@ def retry_sync(max_retries: int = 3, delay: float = 1.0):
                     last_exception = e
                     if attempt < max_retries:
                         logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}")
-                        time.sleep(delay)
+                        time.sleep(_backoff_delay(attempt, delay, max_delay, jitter))
                     else:
                         logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
             
-            raise last_exception
+            if last_exception is not None:
+                raise last_exception
         
         return wrapper
     return decorator
 
+@functools.lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
     """Check if running on Raspberry Pi
     
+    The answer can't change at runtime, so /proc/cpuinfo is read only once.
+    
     Returns:
         True if running on Raspberry Pi
     """
@@ -362,16 +529,13 @@ def is_raspberry_pi() -> bool:
     except:
         return False
 
-def get_system_info() -> Dict[str, Any]:
-    """Get system information
-    
-    Returns:
-        Dictionary with system info
-    """
+@functools.lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
+    """System fields that can't change while the process runs, read once"""
     import platform
     import psutil
     
-    info = {
+    return {
         'platform': platform.system(),
         'platform_release': platform.release(),
         'platform_version': platform.version(),
@@ -381,12 +545,43 @@ def get_system_info() -> Dict[str, Any]:
         'is_raspberry_pi': is_raspberry_pi(),
         'cpu_count': psutil.cpu_count(),
         'memory_total': psutil.virtual_memory().total,
+    }
+
+def get_static_system_info() -> Dict[str, Any]:
+    """Get system information that doesn't change at runtime (cached)
+    
+    Returns:
+        Dictionary with platform, CPU and total memory info
+    """
+    return dict(_static_system_info())
+
+def get_dynamic_system_info() -> Dict[str, Any]:
+    """Get current memory and disk usage
+    
+    Returns:
+        Dictionary with available memory and disk usage percentage
+    """
+    import psutil
+    
+    return {
         'memory_available': psutil.virtual_memory().available,
-        'disk_usage': psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:\\\\').percent
+        'disk_usage': psutil.disk_usage('/' if os.name != 'nt' else 'C:\\').percent
     }
+
+def get_system_info() -> Dict[str, Any]:
+    """Get system information
     
+    Returns:
+        Dictionary with system info
+    """
+    info = get_static_system_info()
+    info.update(get_dynamic_system_info())
     return info
 
+def _compact_timestamp(t: datetime) -> str:
+    """YYYYmmdd_HHMMSS without strftime's locale and format parsing"""
+    return f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+
 def create_backup_filename(original_path: Union[str, Path], suffix: str = None) -> str:
     """Create backup filename with timestamp
     
@@ -398,7 +593,7 @@ def create_backup_filename(original_path: Union[str, Path], suffix: str = None)
         Backup filename
     """
     path_obj = Path(original_path)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _compact_timestamp(datetime.now())
     
     if suffix:
         backup_name = f"{path_obj.stem}_{timestamp}_{suffix}{path_obj.suffix}"
@@ -434,8 +629,7 @@ def parse_duration(duration_str: str) -> float:
     total_seconds = 0.0
     
     # Find all number-unit pairs
-    pattern = r'(\\d+(?:\\.\\d+)?)([smhdw])'
-    matches = re.findall(pattern, duration_str)
+    matches = _DUR_RE.findall(duration_str)
     
     for value_str, unit in matches:
         value = float(value_str)
@@ -444,6 +638,135 @@ def parse_duration(duration_str: str) -> float:
     
     return total_seconds
 
+def _normalize_phrase(text: str) -> str:
+    """Lowercase text and reduce it to single-space separated words"""
+    return ' '.join(_split_words(text.lower()))
+
+class KeywordIndex:
+    """Whole-word matcher for a fixed vocabulary (strain names, terpenes, effects)
+    
+    Text is scanned once regardless of vocabulary size: with an Aho-Corasick
+    automaton when pyahocorasick is installed, otherwise with dictionary
+    lookups over word n-grams.
+    """
+    
+    def __init__(self, vocabulary: Iterable[str]):
+        """Build the index
+        
+        Args:
+            vocabulary: Keywords or multi-word phrases to match
+        """
+        # Normalized phrase -> keyword as given
+        self.keywords: Dict[str, str] = {}
+        for keyword in vocabulary:
+            normalized = _normalize_phrase(keyword)
+            if normalized:
+                self.keywords.setdefault(normalized, keyword)
+        
+        self.max_words = max((phrase.count(' ') + 1 for phrase in self.keywords), default=0)
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for normalized, keyword in self.keywords.items():
+                # Space padding restricts matches to whole words
+                automaton.add_word(f" {normalized} ", keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def find(self, text: str) -> Set[str]:
+        """Find vocabulary keywords present in text
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Set of matched keywords, as given in the vocabulary
+        """
+        if not text or not self.keywords:
+            return set()
+        
+        normalized = _normalize_phrase(text)
+        
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(f" {normalized} ")}
+        
+        words = normalized.split()
+        lookup = self.keywords.get
+        found = set()
+        for start in range(len(words)):
+            for end in range(start + 1, min(start + self.max_words, len(words)) + 1):
+                keyword = lookup(' '.join(words[start:end]))
+                if keyword is not None:
+                    found.add(keyword)
+        
+        return found
+
+class JsonFileCache:
+    """Content-addressed JSON file cache with a time-to-live per entry"""
+    
+    def __init__(self, path: Union[str, Path], ttl: float):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty = False
+    
+    @staticmethod
+    def key_for(*parts: str) -> str:
+        """Derive a cache key from the request parts"""
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _load(self) -> Dict[str, Any]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                if self.path.exists():
+                    self._entries = self._fresh(json.loads(self.path.read_text(encoding='utf-8')))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache {self.path}: {e}")
+        return self._entries
+    
+    def _is_fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        return now - entry['stored_at'] < self.ttl
+    
+    def _fresh(self, entries: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop expired entries so the cache file does not grow without bound"""
+        now = time.time()
+        return {key: entry for key, entry in entries.items() if self._is_fresh(entry, now)}
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached value or None"""
+        entry = self._load().get(key)
+        if entry and self._is_fresh(entry, time.time()):
+            self.hits += 1
+            return entry['value']
+        self.misses += 1
+        return None
+    
+    def put(self, key: str, value: Any):
+        """Store a value under key"""
+        self._load()[key] = {'stored_at': time.time(), 'value': value}
+        self._dirty = True
+    
+    def save(self):
+        """Persist the cache if anything changed"""
+        if not self._dirty:
+            return
+        try:
+            self._entries = self._fresh(self._entries)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A private temp file per writer; concurrent processes may save the same cache
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent,
+                                             suffix='.tmp', delete=False) as f:
+                json.dump(self._entries, f)
+            os.replace(f.name, self.path)
+            self._dirty = False
+            logger.info(f"Saved cache {self.path.name} ({self.hits} hits, {self.misses} misses)")
+        except Exception as e:
+            logger.error(f"Error saving cache {self.path}: {e}")
+
 class RateLimiter:
     """Simple rate limiter"""
     
@@ -456,7 +779,8 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        # Call times in order, oldest first (monotonic clock)
+        self.calls = deque()
     
     def is_allowed(self) -> bool:
         """Check if call is allowed
@@ -464,10 +788,12 @@ class RateLimiter:
         Returns:
             True if call is allowed
         """
-        now = time.time()
+        now = time.monotonic()
         
         # Remove old calls
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+        calls = self.calls
+        while calls and now - calls[0] >= self.time_window:
+            calls.popleft()
         
         # Check if we can make another call
         if len(self.calls) < self.max_calls:
@@ -485,8 +811,8 @@ class RateLimiter:
         if len(self.calls) < self.max_calls:
             return 0.0
         
-        oldest_call = min(self.calls)
-        return self.time_window - (time.time() - oldest_call)
+        oldest_call = self.calls[0]
+        return max(0.0, self.time_window - (time.monotonic() - oldest_call))
 
 # Example usage and tests
 if __name__ == "__main__":
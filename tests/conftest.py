@@ -3,15 +3,21 @@ Pytest configuration and shared fixtures for GrowWiz tests
 """
 
 import pytest
-import sys
 import os
 import tempfile
-import json
+from collections.abc import Mapping
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 from datetime import datetime
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Shared test data, built once per session
+SAMPLE_SENSOR_DATA = {
+    'temperature': 25.5,
+    'humidity': 45.2,
+    'soil_moisture': 72.0,
+    'co2': 550.0,
+    'timestamp': datetime.now().isoformat()
+}
 
 @pytest.fixture
 def temp_database():
@@ -25,108 +31,10 @@ def temp_database():
     if os.path.exists(temp_db.name):
         os.unlink(temp_db.name)
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary configuration file for testing"""
-    config_data = {
-        'server': {
-            'host': '0.0.0.0',
-            'port': 8000,
-            'debug': False
-        },
-        'hardware': {
-            'platform': 'raspberry_pi',
-            'simulation_mode': True
-        },
-        'sensors': {
-            'dht22_pin': 4,
-            'soil_moisture_pin': 0,
-            'co2_address': '0x48',
-            'read_interval': 5
-        },
-        'thresholds': {
-            'temperature': {'min': 18, 'max': 30},
-            'humidity': {'min': 40, 'max': 70},
-            'soil_moisture': {'min': 30, 'max': 80},
-            'co2': {'min': 400, 'max': 1000}
-        },
-        'relay_pins': {
-            'fan': 18,
-            'heater': 19,
-            'humidifier': 20,
-            'pump': 21,
-            'lights': 22,
-            'co2_valve': 23
-        },
-        'ai': {
-            'model_name': 'resnet50',
-            'confidence_threshold': 0.7,
-            'max_image_size': 1024
-        },
-        'database': {
-            'path': 'data/growwiz.db',
-            'backup_interval': 24
-        },
-        'scraping': {
-            'request_delay': 1.0,
-            'max_pages': 10,
-            'keywords': ['cannabis', 'growing', 'hydroponics', 'nutrients']
-        },
-        'logging': {
-            'level': 'INFO',
-            'file': 'logs/growwiz.log',
-            'max_size': 10485760,
-            'backup_count': 5
-        }
-    }
-    
-    temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-    json.dump(config_data, temp_file)
-    temp_file.close()
-    
-    yield temp_file.name
-    
-    # Cleanup
-    if os.path.exists(temp_file.name):
-        os.unlink(temp_file.name)
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sensor_data():
-    """Sample sensor data for testing"""
-    return {
-        'temperature': 25.5,
-        'humidity': 45.2,
-        'soil_moisture': 72.0,
-        'co2': 550.0,
-        'timestamp': datetime.now().isoformat()
-    }
-
-@pytest.fixture
-def sample_plant_diagnosis():
-    """Sample plant diagnosis data for testing"""
-    return {
-        'image_path': '/test/sample_plant.jpg',
-        'primary_diagnosis': 'healthy',
-        'confidence': 0.85,
-        'predictions': [
-            {'condition': 'healthy', 'confidence': 0.85},
-            {'condition': 'nutrient_deficiency', 'confidence': 0.10},
-            {'condition': 'overwatering', 'confidence': 0.05}
-        ],
-        'recommendations': [
-            'Continue current care routine',
-            'Monitor for any changes in leaf color',
-            'Maintain current watering schedule'
-        ],
-        'features': {
-            'brightness': 120.5,
-            'contrast': 45.2,
-            'green_percentage': 78.5,
-            'problem_area_percentage': 5.2,
-            'color_variance': 15.8
-        },
-        'simulation_mode': True
-    }
+    """Sample sensor data for testing (shared across the session, read-only)"""
+    return MappingProxyType(SAMPLE_SENSOR_DATA)
 
 @pytest.fixture
 def sample_automation_event():
@@ -139,16 +47,6 @@ def sample_automation_event():
         'success': True
     }
 
-@pytest.fixture
-def sample_scraped_tip():
-    """Sample scraped tip data for testing"""
-    return {
-        'url': 'http://example.com/growing-tip',
-        'content': 'Maintain humidity levels between 40-60% for optimal cannabis growth',
-        'relevance_score': 0.85,
-        'source': 'forum'
-    }
-
 @pytest.fixture
 def mock_gpio():
     """Mock GPIO module for testing"""
@@ -193,12 +91,12 @@ def mock_i2c():
         mock_bus.return_value.read_i2c_block_data.return_value = [0x02, 0x30, 0x00, 0x00]
         yield mock_bus
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_image_file():
-    """Create a test image file for plant classification"""
+    """Create a test image file for plant classification (shared, read-only)"""
     from PIL import Image
     
-    # Create a simple green image (simulating a plant)
+    # Create a simple green image (simulating a plant); JPEG-encoded once per session
     img = Image.new('RGB', (224, 224), color='green')
     
     # Save to temporary file
@@ -212,31 +110,6 @@ def test_image_file():
     if os.path.exists(temp_file.name):
         os.unlink(temp_file.name)
 
-@pytest.fixture
-def mock_aiohttp_session():
-    """Mock aiohttp session for web scraping tests"""
-    from unittest.mock import AsyncMock
-    
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.text = AsyncMock(return_value="""
-    <html>
-        <body>
-            <div class="post">
-                <p>Cannabis plants need proper lighting for healthy growth.</p>
-            </div>
-            <div class="comment">
-                <p>Maintain temperature between 70-85°F during flowering.</p>
-            </div>
-        </body>
-    </html>
-    """)
-    
-    mock_session = AsyncMock()
-    mock_session.get = AsyncMock(return_value=mock_response)
-    
-    yield mock_session
-
 @pytest.fixture
 def mock_selenium_driver():
     """Mock Selenium WebDriver for web scraping tests"""
@@ -286,17 +159,23 @@ def pytest_collection_modifyitems(config, items):
     """Modify test collection to skip hardware tests when appropriate"""
     import platform
     
-    skip_hardware = pytest.mark.skip(reason="Hardware tests require Raspberry Pi")
-    skip_network = pytest.mark.skip(reason="Network tests require internet connection")
+    # Resolve the platform and options once rather than per collected item
+    skip_hardware = not platform.machine().startswith('arm')
+    skip_network = config.getoption("--no-network", default=False)
+    if not (skip_hardware or skip_network):
+        return
+    
+    hardware_marker = pytest.mark.skip(reason="Hardware tests require Raspberry Pi")
+    network_marker = pytest.mark.skip(reason="Network tests require internet connection")
     
     for item in items:
         # Skip hardware tests if not on Raspberry Pi
-        if "hardware" in item.keywords and not platform.machine().startswith('arm'):
-            item.add_marker(skip_hardware)
+        if skip_hardware and "hardware" in item.keywords:
+            item.add_marker(hardware_marker)
         
         # Skip network tests if --no-network flag is used
-        if "network" in item.keywords and config.getoption("--no-network", default=False):
-            item.add_marker(skip_network)
+        if skip_network and "network" in item.keywords:
+            item.add_marker(network_marker)
 
 def pytest_addoption(parser):
     """Add custom command line options"""
@@ -335,7 +214,7 @@ def create_test_database(db_path):
 
 def assert_sensor_data_valid(sensor_data):
     """Assert that sensor data has valid structure and values"""
-    assert isinstance(sensor_data, dict)
+    assert isinstance(sensor_data, Mapping)
     
     required_fields = ['temperature', 'humidity', 'soil_moisture', 'co2']
     for field in required_fields:
@@ -350,7 +229,7 @@ def assert_sensor_data_valid(sensor_data):
 
 def assert_diagnosis_valid(diagnosis):
     """Assert that plant diagnosis has valid structure"""
-    assert isinstance(diagnosis, dict)
+    assert isinstance(diagnosis, Mapping)
     
     if not diagnosis.get('error'):
         required_fields = [
@@ -408,7 +287,7 @@ class CustomAssertions:
     @staticmethod
     def assert_scraped_tip_valid(tip):
         """Assert scraped tip has valid structure"""
-        assert isinstance(tip, dict)
+        assert isinstance(tip, Mapping)
         
         required_fields = ['url', 'content', 'relevance_score', 'source']
         for field in required_fields:
@@ -3,16 +3,11 @@ Unit tests for GrowWiz automation engine module
 """
 
 import pytest
-import sys
-import os
 import tempfile
 import json
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from automation import AutomationEngine, check_and_trigger
 
 class TestAutomationEngine:
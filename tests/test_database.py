@@ -3,16 +3,12 @@ Unit tests for GrowWiz database manager module
 """
 
 import pytest
-import sys
 import os
 import tempfile
 import sqlite3
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from database import DatabaseManager
 
 class TestDatabaseManager:
@@ -28,13 +24,6 @@ class TestDatabaseManager:
         self.db = DatabaseManager(self.temp_db.name)
         
         # Sample data for testing
-        self.sample_sensor_data = {
-            'temperature': 25.5,
-            'humidity': 45.2,
-            'soil_moisture': 72.0,
-            'co2': 550.0
-        }
-        
         self.sample_diagnosis = {
             'image_path': '/test/image.jpg',
             'primary_diagnosis': 'healthy',
@@ -46,6 +35,11 @@ class TestDatabaseManager:
             'recommendations': ['Continue current care routine', 'Monitor for changes']
         }
     
+    @pytest.fixture(autouse=True)
+    def _use_sample_sensor_data(self, sample_sensor_data):
+        """Read-only sample reading shared across the session"""
+        self.sample_sensor_data = sample_sensor_data
+    
     def teardown_method(self):
         """Clean up after tests"""
         if hasattr(self.db, 'close'):
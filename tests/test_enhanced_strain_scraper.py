@@ -0,0 +1,71 @@
+"""
+Unit tests for GrowWiz enhanced strain scraper module
+"""
+
+import pytest
+import asyncio
+
+from enhanced_strain_scraper import EnhancedStrainScraper
+
+class TestSharedStrainRequests:
+    """Test cases for the per-URL shared strain page fetch"""
+
+    def setup_method(self):
+        """Set up a scraper whose page fetch is a slow stub"""
+        self.scraper = EnhancedStrainScraper()
+        self.fetch_started = asyncio.Event()
+        self.fetches = []
+        self.cancelled_fetches = []
+
+        async def fetch(session, url, site_name):
+            self.fetches.append(url)
+            self.fetch_started.set()
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                self.cancelled_fetches.append(url)
+                raise
+            return f"strain from {url}"
+
+        self.scraper._fetch_individual_strain = fetch
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling one waiter mid-fetch leaves the shared fetch running"""
+        first = asyncio.ensure_future(self.scraper._scrape_individual_strain(None, 'http://a', 'site'))
+        second = asyncio.ensure_future(self.scraper._scrape_individual_strain(None, 'http://a', 'site'))
+        await self.fetch_started.wait()
+
+        first.cancel()
+
+        assert await second == "strain from http://a"
+        assert first.cancelled()
+        assert self.fetches == ['http://a']
+        assert self.cancelled_fetches == []
+        await self.scraper.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_orphaned_fetches(self):
+        """Test aclose stops fetches whose only caller was cancelled"""
+        caller = asyncio.ensure_future(self.scraper._scrape_individual_strain(None, 'http://a', 'site'))
+        await self.fetch_started.wait()
+        caller.cancel()
+
+        await self.scraper.aclose()
+
+        assert self.cancelled_fetches == ['http://a']
+        assert not self.scraper._strain_requests
+        assert not self.scraper._pending_strain_requests
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_retried(self):
+        """Test an empty result is not served to later callers"""
+        async def empty_fetch(session, url, site_name):
+            self.fetches.append(url)
+            return None
+
+        self.scraper._fetch_individual_strain = empty_fetch
+
+        assert await self.scraper._scrape_individual_strain(None, 'http://a', 'site') is None
+        assert await self.scraper._scrape_individual_strain(None, 'http://a', 'site') is None
+        assert self.fetches == ['http://a', 'http://a']
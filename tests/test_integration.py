@@ -4,7 +4,6 @@ Tests the interaction between different modules
 """
 
 import pytest
-import sys
 import os
 import tempfile
 import json
@@ -12,9 +11,6 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sensors import SensorManager
 from plant_classifier import PlantClassifier
 from scraper import GrowTipScraper
@@ -37,7 +33,7 @@ class TestSystemIntegration:
         self.sensors = SensorManager()
         self.classifier = PlantClassifier()
         self.automation = AutomationEngine()
-        self.scraper = GrowTipScraper()
+        self.scraper = GrowTipScraper(use_cache=False)
         
         # Sample data
         self.sample_sensor_data = {
@@ -3,7 +3,6 @@ Unit tests for GrowWiz plant classifier module
 """
 
 import pytest
-import sys
 import os
 import tempfile
 import json
@@ -11,9 +10,6 @@ from unittest.mock import Mock, patch, MagicMock
 from PIL import Image
 import numpy as np
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from plant_classifier import PlantClassifier
 
 class TestPlantClassifier:
@@ -22,26 +18,11 @@ class TestPlantClassifier:
     def setup_method(self):
         """Set up test fixtures"""
         self.classifier = PlantClassifier()
-        
-        # Create a test image
-        self.test_image = self._create_test_image()
-    
-    def teardown_method(self):
-        """Clean up after tests"""
-        if hasattr(self.test_image, 'close'):
-            self.test_image.close()
     
-    def _create_test_image(self):
-        """Create a test image file"""
-        # Create a simple green image (simulating a plant)
-        img = Image.new('RGB', (224, 224), color='green')
-        
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-        img.save(temp_file.name)
-        temp_file.close()
-        
-        return temp_file.name
+    @pytest.fixture(autouse=True)
+    def _use_test_image(self, test_image_file):
+        """Read-only green test image, encoded once per session"""
+        self.test_image = test_image_file
     
     def test_initialization(self):
         """Test classifier initialization"""
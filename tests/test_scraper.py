@@ -3,7 +3,6 @@ Unit tests for GrowWiz web scraper module
 """
 
 import pytest
-import sys
 import os
 import json
 import tempfile
@@ -11,9 +10,6 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from scraper import GrowTipScraper, scrape_grow_forums
 
 class TestGrowTipScraper:
@@ -21,7 +17,7 @@ class TestGrowTipScraper:
     
     def setup_method(self):
         """Set up test fixtures"""
-        self.scraper = GrowTipScraper()
+        self.scraper = GrowTipScraper(use_cache=False)
         
         # Mock HTML content for testing
         self.mock_forum_html = """
@@ -419,7 +415,7 @@ class TestScraperIntegration:
     @pytest.mark.asyncio
     async def test_full_scraping_pipeline(self):
         """Test complete scraping pipeline"""
-        scraper = GrowTipScraper()
+        scraper = GrowTipScraper(use_cache=False)
         
         # Mock the entire pipeline
         mock_response = AsyncMock()
@@ -470,7 +466,7 @@ class TestScraperIntegration:
                 scraper.save_data(temp_file.name)
                 
                 # Load in new scraper instance
-                new_scraper = GrowTipScraper()
+                new_scraper = GrowTipScraper(use_cache=False)
                 new_scraper.load_data(temp_file.name)
                 
                 assert len(new_scraper.scraped_data) == len(scraper.scraped_data)
@@ -484,7 +480,7 @@ class TestScraperIntegration:
     @pytest.mark.asyncio
     async def test_concurrent_scraping(self):
         """Test concurrent scraping of multiple sites"""
-        scraper = GrowTipScraper()
+        scraper = GrowTipScraper(use_cache=False)
         
         # Mock responses for multiple sites
         mock_response = AsyncMock()
@@ -511,6 +507,55 @@ class TestScraperIntegration:
         finally:
             await scraper.close()
 
+class TestScrapeCache:
+    """Test cases for the on-disk Hyperbrowser result cache"""
+    
+    TIP = ("Water cannabis plants only when the top inch of soil is dry; overwatering "
+           "during flowering invites root rot and nutrient lockout in the grow.")
+    
+    def _scraper(self, tmp_path):
+        return GrowTipScraper(cache_path=str(tmp_path / 'scraped_pages.json'))
+    
+    async def _scrape(self, scraper, result):
+        """Run scrape_with_hyperbrowser against a stubbed Hyperbrowser call"""
+        fetch = AsyncMock(return_value=result)
+        with patch('scraper.HYPERBROWSER_AVAILABLE', True), \
+             patch('scraper.scrape_webpage', fetch, create=True), \
+             patch('scraper.asyncio.sleep', AsyncMock()):
+            tips = await scraper.scrape_with_hyperbrowser(['http://test-forum.com'])
+        return tips, fetch.await_count
+    
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, tmp_path):
+        """Test a fresh scraper serves saved results without refetching"""
+        tips, fetches = await self._scrape(self._scraper(tmp_path), {'markdown': self.TIP})
+        assert len(tips) == 1
+        assert fetches == 1
+        
+        cached_tips, fetches = await self._scrape(self._scraper(tmp_path), {'markdown': ''})
+        assert cached_tips == tips
+        assert fetches == 0
+    
+    @pytest.mark.asyncio
+    async def test_empty_results_not_cached(self, tmp_path):
+        """Test a failed or empty scrape is retried on the next run"""
+        tips, _ = await self._scrape(self._scraper(tmp_path), {})
+        assert tips == []
+        
+        tips, fetches = await self._scrape(self._scraper(tmp_path), {'markdown': self.TIP})
+        assert len(tips) == 1
+        assert fetches == 1
+    
+    @pytest.mark.asyncio
+    async def test_expired_results_refetched(self, tmp_path):
+        """Test results older than the TTL are scraped again"""
+        await self._scrape(self._scraper(tmp_path), {'markdown': self.TIP})
+        
+        with patch('scraper.SCRAPE_CACHE_TTL', 0):
+            _, fetches = await self._scrape(self._scraper(tmp_path), {'markdown': self.TIP})
+        
+        assert fetches == 1
+
 if __name__ == '__main__':
     # Run tests
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -3,14 +3,9 @@ Unit tests for GrowWiz sensor module
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 import time
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from sensors import SensorManager
 
 class TestSensorManager:
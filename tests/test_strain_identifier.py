@@ -0,0 +1,175 @@
+"""
+Unit tests for GrowWiz strain identifier module
+"""
+
+import pytest
+import os
+import json
+from unittest.mock import patch
+from PIL import Image
+import numpy as np
+
+import strain_identifier
+from strain_identifier import StrainIdentifier, lbp_uniform_hist, LBP_RADIUS, LBP_POINTS
+
+class TestLBPHistogram:
+    """The Numba LBP kernel must reproduce scikit-image's uniform histogram"""
+
+    def _reference_hist(self, gray):
+        """Uniform LBP histogram straight from scikit-image"""
+        local_binary_pattern = pytest.importorskip("skimage.feature").local_binary_pattern
+        lbp = local_binary_pattern(gray, LBP_POINTS, LBP_RADIUS, method='uniform')
+        counts = np.bincount(lbp.astype(np.int64).ravel(), minlength=LBP_POINTS + 2)
+        return counts / counts.sum()
+
+    @pytest.mark.skipif(not strain_identifier.NUMBA_AVAILABLE, reason="Numba not installed")
+    def test_random_image_matches_skimage(self):
+        """Test a noisy image, which exercises every pattern bin"""
+        gray = np.random.default_rng(0).integers(0, 256, (64, 80), dtype=np.uint8)
+
+        np.testing.assert_allclose(lbp_uniform_hist(gray), self._reference_hist(gray))
+
+    @pytest.mark.skipif(not strain_identifier.NUMBA_AVAILABLE, reason="Numba not installed")
+    def test_flat_image_matches_skimage(self):
+        """Test a flat image, where only the zero-padded border differs from the center"""
+        gray = np.full((32, 32), 128, dtype=np.uint8)
+
+        np.testing.assert_allclose(lbp_uniform_hist(gray), self._reference_hist(gray))
+
+    def test_histogram_is_normalized(self):
+        """Test the histogram has one bin per uniform pattern plus one and sums to 1"""
+        gray = np.random.default_rng(1).integers(0, 256, (16, 16), dtype=np.uint8)
+
+        hist = lbp_uniform_hist(gray)
+
+        assert hist.shape == (LBP_POINTS + 2,)
+        assert hist.sum() == pytest.approx(1.0)
+
+class TestFeatureCache:
+    """Test cases for the on-disk extracted-feature cache"""
+
+    @pytest.fixture
+    def identifier(self, tmp_path):
+        """Identifier with a one-strain database and a private feature cache"""
+        strain_file = tmp_path / 'strains.json'
+        strain_file.write_text(json.dumps([{'name': 'Blue Dream', 'strain_type': 'Hybrid'}]))
+        return StrainIdentifier(strain_data_path=str(strain_file),
+                                feature_cache_dir=str(tmp_path / 'features'))
+
+    @pytest.fixture
+    def image_path(self, tmp_path):
+        """Small green-on-black test image"""
+        img = np.zeros((64, 64, 3), dtype=np.uint8)
+        img[16:48, 16:48] = (40, 160, 40)
+        path = tmp_path / 'bud.png'
+        Image.fromarray(img).save(path)
+        return str(path)
+
+    def test_miss_writes_cache_file(self, identifier, image_path):
+        """Test a first extraction persists one entry"""
+        features = identifier.extract_visual_features(image_path)
+
+        assert features
+        assert len(list(identifier.feature_cache_dir.glob('*.pkl'))) == 1
+        assert not list(identifier.feature_cache_dir.glob('*.tmp'))
+
+    def test_hit_skips_decoding(self, identifier, image_path, tmp_path):
+        """Test a fresh identifier serves the features from disk"""
+        features = identifier.extract_visual_features(image_path)
+        fresh = StrainIdentifier(strain_data_path=str(tmp_path / 'strains.json'),
+                                 feature_cache_dir=str(identifier.feature_cache_dir))
+
+        with patch.object(fresh, '_decode_image', side_effect=AssertionError("decoded")):
+            assert fresh.extract_visual_features(image_path) == features
+
+    def test_version_bump_invalidates_entries(self, identifier, image_path, monkeypatch):
+        """Test features from an older analysis version are not served"""
+        identifier.extract_visual_features(image_path)
+        monkeypatch.setattr(strain_identifier, 'FEATURE_CACHE_VERSION',
+                            strain_identifier.FEATURE_CACHE_VERSION + 1)
+        identifier._feat_cache.clear()
+
+        with patch.object(identifier, '_decode_image', wraps=identifier._decode_image) as decode:
+            identifier.extract_visual_features(image_path)
+
+        decode.assert_called_once()
+        assert len(list(identifier.feature_cache_dir.glob('*.pkl'))) == 2
+
+    def test_prune_keeps_most_recent(self, identifier):
+        """Test pruning removes the least recently used entries"""
+        cache_dir = identifier.feature_cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(5):
+            entry = cache_dir / f'{i}.pkl'
+            entry.write_bytes(b'')
+            os.utime(entry, (i, i))
+
+        identifier._prune_feature_cache(max_files=2)
+
+        assert sorted(p.name for p in cache_dir.glob('*.pkl')) == ['3.pkl', '4.pkl']
+
+class TestStrainDatabaseCache:
+    """Test cases for the pickled strain database cache"""
+
+    def test_cache_lives_outside_data_dir(self, tmp_path):
+        """Test nothing is written next to the strain file"""
+        strain_file = tmp_path / 'data' / 'strains.json'
+        strain_file.parent.mkdir()
+        strain_file.write_text(json.dumps([{'name': 'Blue Dream'}]))
+
+        identifier = StrainIdentifier(strain_data_path=str(strain_file),
+                                      feature_cache_dir=str(tmp_path / 'features'))
+
+        assert os.listdir(strain_file.parent) == ['strains.json']
+        assert len(list((identifier.feature_cache_dir / 'strain_db').glob('*.pkl'))) == 1
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Test an edited strain file is not served from the cache"""
+        strain_file = tmp_path / 'strains.json'
+        strain_file.write_text(json.dumps([{'name': 'Blue Dream'}]))
+        StrainIdentifier(strain_data_path=str(strain_file),
+                         feature_cache_dir=str(tmp_path / 'features'))
+
+        strain_file.write_text(json.dumps([{'name': 'Blue Dream'}, {'name': 'OG Kush'}]))
+        identifier = StrainIdentifier(strain_data_path=str(strain_file),
+                                      feature_cache_dir=str(tmp_path / 'features'))
+
+        assert set(identifier.strain_database) == {'Blue Dream', 'OG Kush'}
+
+class TestTopK:
+    """_top_k_indices must match a full stable sort, ties included"""
+
+    @pytest.mark.parametrize("k", [1, 5, 199, 200, 250])
+    def test_tied_scores_keep_database_order(self, k):
+        """Test random tied scores select the same strains, in the same order"""
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            scores = rng.choice(np.array([0.3, 0.5, 0.7], dtype=np.float32), size=200)
+
+            expected = np.argsort(-scores, kind='stable')[:k]
+
+            np.testing.assert_array_equal(strain_identifier._top_k_indices(scores, k), expected)
+
+    def test_empty(self):
+        """Test no scores or k=0 select nothing"""
+        assert len(strain_identifier._top_k_indices(np.zeros(0, dtype=np.float32), 5)) == 0
+        assert len(strain_identifier._top_k_indices(np.ones(3, dtype=np.float32), 0)) == 0
+
+class TestShapeScale:
+    """Shape features must be reported in original-image pixels"""
+
+    def test_downsampled_shape_matches_original_units(self, tmp_path):
+        """Test a large image reports the bud at its full-resolution size"""
+        img = np.zeros((1024, 1024, 3), dtype=np.uint8)
+        img[256:768, 128:896] = (40, 160, 40)
+        path = tmp_path / 'large.png'
+        Image.fromarray(img).save(path)
+        identifier = StrainIdentifier(strain_data_path=str(path.with_suffix('.json')),
+                                      feature_cache_dir=str(tmp_path / 'features'))
+
+        features = identifier.extract_visual_features(str(path))
+
+        assert features['analysis_scale'] == pytest.approx(4.0)
+        assert features['bounding_box'] == pytest.approx([128, 256, 768, 512], abs=4)
+        assert features['bud_area'] == pytest.approx(768 * 512, rel=0.02)
+        assert features['image_dimensions'] == {'width': 1024, 'height': 1024}
@@ -0,0 +1,192 @@
+"""
+Unit tests for GrowWiz utility functions
+"""
+
+import pytest
+import re
+import json
+from unittest.mock import patch
+
+import utils
+from utils import (
+    JsonFileCache, extract_keywords, calculate_similarity, batch_similarity,
+    validate_sensor_data, validate_sensor_data_batch, KeywordIndex
+)
+
+class TestExtractKeywords:
+    """Test cases for extract_keywords"""
+
+    @pytest.mark.parametrize("text", [
+        "Keep humidity at 40-50% (late flower); don't overwater!",
+        "snake_case stays whole\x1fcontrol\x00chars split",
+        "“Blue Dream” – a sativa‑dominant hybrid… très populaire",
+        "Terpenes: myrcene/limonene ¿caryophyllene? «pinene»",
+    ])
+    def test_matches_word_regex(self, text):
+        """Test words are exactly the \\w+ runs, for ASCII and Unicode punctuation"""
+        expected = []
+        for word in re.findall(r'\w+', text.lower()):
+            if len(word) >= 3 and word not in utils.STOP_WORDS and word not in expected:
+                expected.append(word)
+
+        assert extract_keywords(text) == expected
+
+    def test_unicode_punctuation_splits_words(self):
+        """Test curly quotes and dashes do not glue words together"""
+        assert extract_keywords("“indica”—dominant") == ['indica', 'dominant']
+
+class TestBatchSimilarity:
+    """batch_similarity must agree with calculate_similarity pair by pair"""
+
+    def test_matches_pairwise_similarity(self):
+        """Test every cell equals the scalar similarity, empty texts included"""
+        texts = [
+            "Blue Dream is a sativa-dominant hybrid with sweet berry aroma",
+            "OG Kush is an indica-leaning hybrid with earthy pine aroma",
+            "Sweet berry aroma and a relaxed, euphoric high",
+            "",
+            "the and of",
+        ]
+
+        matrix = batch_similarity(texts)
+
+        for i, text1 in enumerate(texts):
+            for j, text2 in enumerate(texts):
+                assert matrix[i][j] == pytest.approx(calculate_similarity(text1, text2))
+
+class TestValidateSensorDataBatch:
+    """validate_sensor_data_batch must agree with validate_sensor_data row by row"""
+
+    ROWS = [
+        {'timestamp': '2024-01-01T00:00:00', 'temperature': 25.555, 'humidity': '60.126'},
+        {'temperature': 150, 'humidity': -1, 'co2': 800},
+        {'temperature': 'warm', 'soil_moisture': None, 'light': 'on'},
+        {'co2': float('nan'), 'humidity': True, 'temperature': float('inf')},
+        {'temperature': -50, 'humidity': 100, 'soil_moisture': '0', 'co2': 5000},
+        {},
+    ]
+
+    def test_matches_scalar_validation(self):
+        """Test each row equals validate_sensor_data, values and key order"""
+        expected = [validate_sensor_data(row) for row in self.ROWS]
+
+        result = validate_sensor_data_batch(self.ROWS)
+
+        assert result == expected
+        assert [list(row) for row in result] == [list(row) for row in expected]
+
+    @pytest.mark.parametrize("rows", [[], [{'temperature': 21.004}]])
+    def test_small_batches(self, rows):
+        """Test empty and single-row batches"""
+        assert validate_sensor_data_batch(rows) == [validate_sensor_data(row) for row in rows]
+
+    def test_input_rows_untouched(self):
+        """Test the caller's rows are not modified"""
+        rows = [{'temperature': 300}, {'temperature': 20}]
+
+        validate_sensor_data_batch(rows)
+
+        assert rows == [{'temperature': 300}, {'temperature': 20}]
+
+class TestKeywordIndex:
+    """The Aho-Corasick and n-gram backends must find the same keywords"""
+
+    VOCABULARY = ['Blue Dream', 'Dream', 'OG Kush', 'Kush', 'myrcene', 'Beta-Caryophyllene',
+                  'sour diesel', 'Diesel', 'euphoric', 'berry']
+    DESCRIPTIONS = [
+        "Blue Dream is a sativa-dominant cross of Blueberry and Haze.",
+        "An OG Kush phenotype, heavy on myrcene and beta caryophyllene.",
+        "“Sour Diesel” – energizing, euphoric… with a diesel nose",
+        "Dreamy kushes and blueberry notes should not match partial words",
+        "",
+    ]
+
+    def _index(self, use_automaton):
+        """Index built with the requested backend"""
+        with patch.object(utils, 'AHOCORASICK_AVAILABLE', use_automaton):
+            index = KeywordIndex(self.VOCABULARY)
+        assert (index._automaton is not None) == use_automaton
+        return index
+
+    def test_ngram_backend_matches(self):
+        """Test the fallback finds whole words and phrases only"""
+        index = self._index(use_automaton=False)
+
+        assert index.find(self.DESCRIPTIONS[0]) == {'Blue Dream', 'Dream'}
+        assert index.find(self.DESCRIPTIONS[1]) == {'OG Kush', 'Kush', 'myrcene', 'Beta-Caryophyllene'}
+        assert index.find(self.DESCRIPTIONS[2]) == {'sour diesel', 'Diesel', 'euphoric'}
+        assert index.find(self.DESCRIPTIONS[3]) == set()
+        assert index.find(self.DESCRIPTIONS[4]) == set()
+
+    def test_backends_agree(self):
+        """Test both backends return identical matches"""
+        pytest.importorskip("ahocorasick")
+        automaton_index = self._index(use_automaton=True)
+        ngram_index = self._index(use_automaton=False)
+
+        for description in self.DESCRIPTIONS:
+            assert automaton_index.find(description) == ngram_index.find(description)
+
+    def test_similarity_with_index(self):
+        """Test calculate_similarity compares only vocabulary keywords"""
+        index = self._index(use_automaton=False)
+
+        assert calculate_similarity("Blue Dream, fruity", "blue dream - earthy", index=index) == 1.0
+
+class TestJsonFileCache:
+    """Test cases for JsonFileCache"""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Test a stored value is served until it expires"""
+        cache = JsonFileCache(tmp_path / 'cache.json', ttl=60)
+
+        assert cache.get('key') is None
+        cache.put('key', {'tips': ['water less']})
+
+        assert cache.get('key') == {'tips': ['water less']}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_save_and_reload(self, tmp_path):
+        """Test entries survive a save and a fresh instance"""
+        path = tmp_path / 'nested' / 'cache.json'
+        cache = JsonFileCache(path, ttl=60)
+        cache.put('key', [1, 2, 3])
+        cache.save()
+
+        assert JsonFileCache(path, ttl=60).get('key') == [1, 2, 3]
+        assert [p.name for p in path.parent.iterdir()] == ['cache.json']
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test entries older than the TTL are not served"""
+        cache = JsonFileCache(tmp_path / 'cache.json', ttl=60)
+        with patch.object(utils.time, 'time', return_value=1000.0):
+            cache.put('key', 'value')
+
+        with patch.object(utils.time, 'time', return_value=1061.0):
+            assert cache.get('key') is None
+
+    def test_save_drops_expired_entries(self, tmp_path):
+        """Test stale entries are not written back"""
+        path = tmp_path / 'cache.json'
+        cache = JsonFileCache(path, ttl=60)
+        with patch.object(utils.time, 'time', return_value=1000.0):
+            cache.put('old', 'value')
+        with patch.object(utils.time, 'time', return_value=1050.0):
+            cache.put('new', 'value')
+
+        with patch.object(utils.time, 'time', return_value=1070.0):
+            cache.save()
+
+        assert set(json.loads(path.read_text())) == {'new'}
+
+    def test_load_drops_expired_entries(self, tmp_path):
+        """Test stale entries in the file are discarded on load"""
+        path = tmp_path / 'cache.json'
+        path.write_text(json.dumps({
+            'old': {'stored_at': 0, 'value': 'stale'},
+            'new': {'stored_at': 1000.0, 'value': 'fresh'},
+        }))
+        cache = JsonFileCache(path, ttl=60)
+
+        with patch.object(utils.time, 'time', return_value=1010.0):
+            assert set(cache._load()) == {'new'}